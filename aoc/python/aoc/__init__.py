@@ -0,0 +1,122 @@
+"""Shared helpers for the Advent of Code 2024 Python solutions.
+
+Only the core helpers (inputs, geometry, grid, utils) are imported with
+the package, so ``import aoc`` costs little more than the interpreter.
+Every other name is imported from its submodule the first time it is
+used, through the module ``__getattr__`` below, and optional heavy
+dependencies (numpy, networkx, pyvis) are loaded through ``lazy_import``
+the first time a code path needs them.
+"""
+import importlib
+
+from .geometry import (Direction, Direction8, Point, PointCodec, Vector,
+                       manhattan_offset_array, manhattan_offsets)
+from .grid import (SPARSE_THRESHOLD, AdaptiveGrid, Grid, SparseGrid,
+                   make_grid)
+from .inputs import (InputType, get_filepath, iter_lines, iter_records,
+                     map_file, parse_file)
+from .lazy import LazyModule, lazy_import
+from .utils import chunk_list, chunk_pairs, get_last_index
+
+_LAZY_SUBMODULES = {
+    'bignum': ('batch_long_add', 'batch_long_multiply', 'digits_to_int',
+               'int_to_digits', 'long_multiply', 'long_sum',
+               'scalar_digit_multiply'),
+    'cache': ('cached_parse', 'file_digest', 'get_cache_dir'),
+    'display': ('FramePlayer', 'FrameRecorder', 'visualise'),
+    'generate': ('GENERATORS', 'generate_input', 'register_generator',
+                 'write_input'),
+    'memo': ('Eviction', 'HashedTuple', 'MemoCache', 'MemoStats', 'memoize'),
+    'search': ('SearchResult', 'astar', 'bfs', 'bfs01', 'dijkstra',
+               'grid_neighbors', 'manhattan_distance'),
+    'timing': ('BenchmarkResult', 'CProfileProfiler', 'PROFILERS',
+               'Profiler', 'SamplingProfiler', 'TimeUnit',
+               'TracemallocProfiler', 'benchmark', 'format_duration',
+               'profiled', 'register_profiler', 'timer'),
+    'wordsearch': ('BitBoards', 'Template'),
+}
+_LAZY = {name: module for module, names in _LAZY_SUBMODULES.items()
+         for name in names}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = [
+    'AdaptiveGrid',
+    'BenchmarkResult',
+    'BitBoards',
+    'CProfileProfiler',
+    'Direction',
+    'Direction8',
+    'Eviction',
+    'FramePlayer',
+    'FrameRecorder',
+    'GENERATORS',
+    'Grid',
+    'HashedTuple',
+    'InputType',
+    'LazyModule',
+    'MemoCache',
+    'MemoStats',
+    'PROFILERS',
+    'Point',
+    'PointCodec',
+    'Profiler',
+    'SPARSE_THRESHOLD',
+    'SamplingProfiler',
+    'SearchResult',
+    'SparseGrid',
+    'Template',
+    'TimeUnit',
+    'TracemallocProfiler',
+    'Vector',
+    'astar',
+    'batch_long_add',
+    'batch_long_multiply',
+    'benchmark',
+    'bfs',
+    'bfs01',
+    'cached_parse',
+    'chunk_list',
+    'chunk_pairs',
+    'digits_to_int',
+    'dijkstra',
+    'file_digest',
+    'format_duration',
+    'generate_input',
+    'get_cache_dir',
+    'get_filepath',
+    'get_last_index',
+    'grid_neighbors',
+    'int_to_digits',
+    'iter_lines',
+    'iter_records',
+    'lazy_import',
+    'long_multiply',
+    'long_sum',
+    'make_grid',
+    'manhattan_distance',
+    'manhattan_offset_array',
+    'manhattan_offsets',
+    'map_file',
+    'memoize',
+    'parse_file',
+    'profiled',
+    'register_generator',
+    'register_profiler',
+    'scalar_digit_multiply',
+    'timer',
+    'visualise',
+    'write_input',
+]
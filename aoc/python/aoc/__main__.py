@@ -0,0 +1,178 @@
+import argparse
+import pathlib
+import sys
+from time import perf_counter_ns
+
+from . import bench, runner
+from .display import FramePlayer
+from .generate import DEFAULT_FILENAME, GENERATORS, write_input
+from .inputs import InputType
+from .timing import TimeUnit
+
+
+def add_run_parser(subparsers):
+    parser = subparsers.add_parser(
+        'run', help='run day solutions in parallel and report answers')
+    parser.add_argument('--root', default='.',
+                        help='directory containing the dayNN folders')
+    parser.add_argument('-d', '--day', type=int, nargs='+',
+                        help='only run these days')
+    parser.add_argument('-p', '--part', type=int, nargs='+', default=[1, 2],
+                        choices=[1, 2], help='only run these parts')
+    parser.add_argument('-i', '--input', nargs='+', default=['input'],
+                        choices=[t.name.lower() for t in InputType],
+                        help='input types to run each part on')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes (default: one per core)')
+    parser.add_argument('--unit', default='ms',
+                        choices=[u.name for u in TimeUnit])
+    parser.add_argument('--json', help='also write the report to this file')
+    parser.set_defaults(command=run)
+
+
+def run(args) -> int:
+    days = runner.discover_days(args.root)
+    if args.day:
+        days = [d for d in days if d.day in args.day]
+    if not days:
+        print('No matching days found', file=sys.stderr)
+        return 1
+    input_names = [name.upper() for name in args.input]
+    ts = perf_counter_ns()
+    results = runner.run(days, args.part, input_names, jobs=args.jobs)
+    wall_seconds = (perf_counter_ns() - ts) / 1e9
+    print(runner.format_report(results, wall_seconds, TimeUnit[args.unit]))
+    if args.json:
+        runner.write_report(results, wall_seconds, args.json)
+    return 1 if any(r.status == 'error' for r in results) else 0
+
+
+def add_play_parser(subparsers):
+    parser = subparsers.add_parser(
+        'play', help='replay a file written by FrameRecorder')
+    parser.add_argument('path')
+    parser.add_argument('--delay', type=float, default=0.05,
+                        help='seconds to wait between frames')
+    parser.add_argument('--no-clear', action='store_true',
+                        help='do not clear the terminal between frames')
+    parser.set_defaults(command=play)
+
+
+def play(args) -> int:
+    FramePlayer(args.path).play(delay=args.delay, clear=not args.no_clear)
+    return 0
+
+
+def add_generate_parser(subparsers):
+    parser = subparsers.add_parser(
+        'generate', help='write synthetic inputs for scaling benchmarks')
+    parser.add_argument('--root', default='.',
+                        help='directory containing the dayNN folders')
+    parser.add_argument('-d', '--day', type=int, nargs='+',
+                        help='only generate these days')
+    parser.add_argument('-s', '--size', type=float, default=1,
+                        help='scale relative to a puzzle-sized input')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', default=DEFAULT_FILENAME,
+                        help='file name to write in each day directory')
+    parser.set_defaults(command=generate)
+
+
+def generate(args) -> int:
+    days = args.day or sorted(GENERATORS)
+    for day in days:
+        directory = pathlib.Path(args.root) / f'day{day:02d}'
+        if day not in GENERATORS or not directory.is_dir():
+            print(f'No generator or directory for day {day}', file=sys.stderr)
+            return 1
+        path = write_input(day, directory, args.size, args.seed, args.output)
+        print(f'Wrote {path} ({path.stat().st_size} bytes)')
+    return 0
+
+
+def add_bench_parser(subparsers):
+    parser = subparsers.add_parser(
+        'bench', help='benchmark days against a stored baseline')
+    parser.add_argument('--root', default='.',
+                        help='directory containing the dayNN folders')
+    parser.add_argument('-d', '--day', type=int, nargs='+',
+                        help='only benchmark these days')
+    parser.add_argument('-p', '--part', type=int, nargs='+', default=[1, 2],
+                        choices=[1, 2], help='only benchmark these parts')
+    parser.add_argument('-i', '--input', nargs='+', default=['generated'],
+                        choices=[t.name.lower() for t in InputType],
+                        help='input types to benchmark each part on')
+    parser.add_argument('-s', '--size', type=float, nargs='+',
+                        default=list(bench.DEFAULT_SIZES),
+                        help='sizes of the generated inputs')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-r', '--repeat', type=int,
+                        default=bench.DEFAULT_REPEAT,
+                        help='timed runs per case (the best is compared; '
+                             f'default: {bench.DEFAULT_REPEAT})')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='cases to run at once (default: 1)')
+    parser.add_argument('--timeout', type=int, default=60,
+                        help='seconds before a case is abandoned (0: never)')
+    parser.add_argument('--no-alloc', action='store_true',
+                        help='skip the tracemalloc run')
+    parser.add_argument('--unit', default='ms',
+                        choices=[u.name for u in TimeUnit])
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--baseline',
+                        help='results file from an earlier --json run')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed slowdown as a fraction (default: 0.2)')
+    parser.add_argument('--memory-threshold', type=float,
+                        help='allowed peak RSS growth as a fraction')
+    parser.add_argument('--min-time', type=float, default=0.001,
+                        help='ignore cases faster than this many seconds')
+    parser.set_defaults(command=benchmark)
+
+
+def benchmark(args) -> int:
+    days = runner.discover_days(args.root)
+    if args.day:
+        days = [d for d in days if d.day in args.day]
+    if not days:
+        print('No matching days found', file=sys.stderr)
+        return 1
+    cases = bench.make_cases(days, args.part,
+                             [name.upper() for name in args.input],
+                             args.size, args.seed)
+    results = bench.run(cases, args.repeat, not args.no_alloc, args.timeout,
+                        args.jobs)
+    baseline = bench.load_results(args.baseline) if args.baseline else None
+    print(bench.format_report(results, baseline, TimeUnit[args.unit]))
+    if args.json:
+        bench.write_results(results, args.json)
+    errors = sum(r.status == 'error' for r in results)
+    skipped = sum(r.status == 'skipped' for r in results)
+    regressions = []
+    if baseline is not None:
+        regressions = bench.compare(results, baseline, args.threshold,
+                                    args.memory_threshold, args.min_time)
+    print(f'\n{len(results)} cases, {errors} errors, {skipped} skipped, '
+          f'{len(regressions)} regressions')
+    for r in regressions:
+        if r.metric == 'missing':
+            print(f'  {r.key}: measured in the baseline, not now')
+        else:
+            print(f'  {r.key}: {r.metric} {r.baseline:g} -> {r.current:g} '
+                  f'({r.ratio:.2f}x)')
+    return 1 if errors or regressions else 0
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m aoc')
+    subparsers = parser.add_subparsers(required=True)
+    add_run_parser(subparsers)
+    add_play_parser(subparsers)
+    add_generate_parser(subparsers)
+    add_bench_parser(subparsers)
+    args = parser.parse_args(argv)
+    return args.command(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
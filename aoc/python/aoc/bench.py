@@ -0,0 +1,305 @@
+"""Cross-day benchmark suite with a stored baseline to compare against.
+
+Every (day, part, input, size) case runs in a fresh worker process, so
+peak RSS belongs to that case alone, and in a temporary copy of its day
+directory, so the day's other data files are found and parts writing
+output files leave the real directories untouched. Generated inputs are
+written into the copy both as ``generated.txt`` and as ``input.txt``,
+for the days that only ever read their real input.
+
+Memory is reported as peak RSS, the traced peak of Python allocations and
+the blocks a part leaves allocated; allocation counts are not recorded.
+"""
+import contextlib
+import gc
+import io
+import json
+import os
+import pathlib
+import shutil
+import signal
+import sys
+import tempfile
+import tracemalloc
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, fields
+from time import perf_counter_ns
+
+from .generate import DEFAULT_FILENAME, generate_input
+from .inputs import InputType
+from .runner import (DayModule, SkipPart, load_day, reads_input_file,
+                     resolve_part)
+from .timing import TimeUnit, format_duration
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_SIZES = (0.1, 1)
+# Timed runs per case; the best of several is far steadier than one run.
+DEFAULT_REPEAT = 5
+# Left out of the temporary day directories: caches and build output.
+_IGNORE = shutil.ignore_patterns('__pycache__', '.aoc_cache', 'target',
+                                 'output*', '*.frames', DEFAULT_FILENAME)
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    day: DayModule
+    part: int
+    input: str
+    size: float | None = None
+    seed: int = 0
+
+    @property
+    def key(self) -> str:
+        key = f'day{self.day.day:02d}/part{self.part}/{self.input.lower()}'
+        return key if self.size is None else f'{key}@{self.size:g}'
+
+
+@dataclass
+class BenchResult:
+    key: str
+    day: int
+    part: int
+    input: str
+    size: float | None = None
+    seconds: list[float] = field(default_factory=list)
+    peak_rss_kib: int | None = None
+    retained_blocks: int | None = None
+    alloc_peak_bytes: int | None = None
+    error: str | None = None
+    skipped: bool = False
+
+    @property
+    def status(self) -> str:
+        if self.skipped:
+            return 'skipped'
+        return 'error' if self.error is not None else 'ok'
+
+    @property
+    def best(self) -> float | None:
+        return min(self.seconds) if self.seconds else None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'BenchResult':
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+
+@dataclass
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def make_cases(days: list[DayModule], parts: list[int],
+               input_names: list[str], sizes: list[float] = DEFAULT_SIZES,
+               seed: int = 0) -> list[BenchCase]:
+    """Generated inputs are run once per size, other inputs once each."""
+    cases = []
+    for day in days:
+        for part in parts:
+            for input_name in input_names:
+                if input_name == InputType.GENERATED.name:
+                    cases.extend(BenchCase(day, part, input_name, size, seed)
+                                 for size in sizes)
+                else:
+                    cases.append(BenchCase(day, part, input_name))
+    return cases
+
+
+def _start_alarm(seconds: int) -> bool:
+    """Raise ``TimeoutError`` in this process after ``seconds``, if we can."""
+    if not seconds or not hasattr(signal, 'SIGALRM'):
+        return False
+
+    def handler(signum, frame):
+        raise TimeoutError(f'timed out after {seconds}s')
+    signal.signal(signal.SIGALRM, handler)
+    signal.alarm(seconds)
+    return True
+
+
+def _copy_day(day: DayModule, directory: str) -> DayModule:
+    copy = pathlib.Path(directory) / day.directory.name
+    shutil.copytree(day.directory, copy, ignore=_IGNORE)
+    return DayModule(day.day, copy / day.path.relative_to(day.directory))
+
+
+def bench_case(case: BenchCase, repeat: int = DEFAULT_REPEAT,
+               allocations: bool = True, timeout: int = 0) -> BenchResult:
+    """Time one case, then rerun it under ``tracemalloc`` if asked.
+
+    Peak RSS is read from ``getrusage`` after the timed runs, before
+    tracing inflates it. ``alloc_peak_bytes`` is the traced peak and
+    ``retained_blocks`` the net change in allocated memory blocks over the
+    traced run: what the part leaves alive, not how much it allocated.
+    The number of allocations is not recorded: CPython keeps no running
+    total, and a ``tracemalloc`` snapshot only counts the blocks still
+    alive when it is taken. The parse cache is bypassed so parsing is
+    always timed.
+    """
+    result = BenchResult(case.key, case.day.day, case.part, case.input,
+                         case.size)
+    os.environ['AOC_NO_CACHE'] = '1'
+    stdout = io.StringIO()
+    alarm = False
+    cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as directory, \
+                contextlib.redirect_stdout(stdout):
+            day = _copy_day(case.day, directory)
+            input_name = case.input
+            if case.size is not None:
+                text = generate_input(case.day.day, case.size, case.seed)
+                for path in (day.path.parent / DEFAULT_FILENAME,
+                             day.directory / 'input.txt'):
+                    path.write_text(text, encoding='utf-8')
+            try:
+                module = load_day(day)
+                if case.size is not None \
+                        and reads_input_file(module, case.part):
+                    input_name = InputType.INPUT.name
+                function, args = resolve_part(module, case.part, input_name)
+                alarm = _start_alarm(timeout)
+                for _ in range(repeat):
+                    ts = perf_counter_ns()
+                    function(*args)
+                    result.seconds.append((perf_counter_ns() - ts) / 1e9)
+                if resource is not None:
+                    result.peak_rss_kib = resource.getrusage(
+                        resource.RUSAGE_SELF).ru_maxrss
+                if allocations:
+                    gc.collect()
+                    blocks = sys.getallocatedblocks()
+                    tracemalloc.start()
+                    try:
+                        function(*args)
+                        _, result.alloc_peak_bytes = \
+                            tracemalloc.get_traced_memory()
+                    finally:
+                        tracemalloc.stop()
+                    result.retained_blocks = \
+                        sys.getallocatedblocks() - blocks
+            finally:
+                os.chdir(cwd)
+    except SkipPart as e:
+        result.skipped = True
+        result.error = str(e)
+    except Exception:
+        result.error = traceback.format_exc(limit=-1).strip().splitlines()[-1]
+    finally:
+        if alarm:
+            signal.alarm(0)
+    return result
+
+
+def run(cases: list[BenchCase], repeat: int = DEFAULT_REPEAT,
+        allocations: bool = True, timeout: int = 0, jobs: int = 1
+        ) -> list[BenchResult]:
+    """Run every case, each in its own worker process.
+
+    ``jobs`` defaults to 1 so that cases do not compete for cores.
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs,
+                             max_tasks_per_child=1) as executor:
+        futures = [executor.submit(bench_case, case, repeat, allocations,
+                                   timeout) for case in cases]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return sorted(results, key=lambda r: (r.day, r.part, r.input,
+                                          r.size or 0))
+
+
+def write_results(results: list[BenchResult], path: str | pathlib.Path):
+    data = {'results': [asdict(r) for r in results]}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+
+def load_results(path: str | pathlib.Path) -> dict[str, BenchResult]:
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    results = [BenchResult.from_dict(r) for r in data['results']]
+    return {r.key: r for r in results}
+
+
+def compare(results: list[BenchResult], baseline: dict[str, BenchResult],
+            threshold: float = 0.2, memory_threshold: float = None,
+            min_seconds: float = 0.001) -> list[Regression]:
+    """Cases slower (or bigger) than the baseline by more than a fraction.
+
+    Times are compared best to best, and ``threshold=0.2`` flags a best
+    time over 20% slower than the baseline's. A case is also only flagged
+    when every current run is slower than every baseline run, so a
+    baseline whose own runs spread over the current time does not count,
+    and cases where both times are under ``min_seconds`` are too noisy to
+    judge. Peak RSS is only checked when ``memory_threshold`` is given.
+    A case measured in the baseline but skipped or failing now is a
+    ``missing`` regression, so losing a measurement does not pass.
+    """
+    regressions = []
+    for r in results:
+        old = baseline.get(r.key)
+        if old is None or old.status != 'ok':
+            continue
+        if r.status != 'ok':
+            regressions.append(Regression(r.key, 'missing', old.best,
+                                          float('nan')))
+            continue
+        if max(r.best, old.best) >= min_seconds \
+                and r.best > old.best * (1 + threshold) \
+                and r.best > max(old.seconds):
+            regressions.append(Regression(r.key, 'time', old.best, r.best))
+        if memory_threshold is not None and r.peak_rss_kib \
+                and old.peak_rss_kib \
+                and r.peak_rss_kib > old.peak_rss_kib * (1 + memory_threshold):
+            regressions.append(Regression(r.key, 'rss', old.peak_rss_kib,
+                                          r.peak_rss_kib))
+    return regressions
+
+
+def format_report(results: list[BenchResult],
+                  baseline: dict[str, BenchResult] = None,
+                  unit: TimeUnit = TimeUnit.ms) -> str:
+    rows = [('case', 'status', 'time', 'peak rss', 'retained blocks',
+             'alloc peak', 'vs baseline')]
+    for r in results:
+        if r.status != 'ok':
+            rows.append((r.key, r.status, '', '', '', '', r.error or ''))
+            continue
+        old = baseline.get(r.key) if baseline else None
+        change = ''
+        if old is not None and old.status == 'ok' and old.best:
+            change = f'{r.best / old.best:.2f}x'
+        rows.append((r.key, r.status, format_duration(r.best, unit),
+                     _kib(r.peak_rss_kib), _optional(r.retained_blocks),
+                     _kib(r.alloc_peak_bytes and r.alloc_peak_bytes // 1024),
+                     change))
+    widths = [max(len(row[i]) for row in rows) for i in range(6)]
+    lines = ['  '.join(cell.ljust(width) for cell, width in zip(row, widths))
+             + '  ' + row[-1] for row in rows]
+    skipped = [r for r in results if r.status == 'skipped']
+    if skipped:
+        lines.append('')
+        lines.append(f'Not measured ({len(skipped)} skipped cases):')
+        lines.extend(f'  {r.key}: {r.error}' for r in skipped)
+    return '\n'.join(lines)
+
+
+def _kib(value: int | None) -> str:
+    return '' if value is None else f'{value / 1024:.1f} MiB'
+
+
+def _optional(value: int | None) -> str:
+    return '' if value is None else str(value)
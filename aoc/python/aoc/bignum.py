@@ -0,0 +1,154 @@
+from .lazy import lazy_import
+
+np = lazy_import('numpy')
+
+# Python refuses int <-> str conversions beyond ~4300 digits, so longer
+# numbers are converted in chunks of this many digits.
+_CHUNK_DIGITS = 1000
+# Below this many digits per number the native-int path beats NumPy.
+NUMPY_MIN_DIGITS = 64
+
+
+def digits_to_int(digits: tuple[int, ...] | list[int]) -> int:
+    if len(digits) <= _CHUNK_DIGITS:
+        return int(bytes(d + 48 for d in digits) or b'0')
+    value = 0
+    for start in range(0, len(digits), _CHUNK_DIGITS):
+        chunk = digits[start:start + _CHUNK_DIGITS]
+        value = value * 10 ** len(chunk) + digits_to_int(chunk)
+    return value
+
+
+def int_to_digits(value: int) -> tuple[int, ...]:
+    if value < 10 ** _CHUNK_DIGITS:
+        return tuple(c - 48 for c in str(value).encode())
+    chunks = []
+    while value >= 10 ** _CHUNK_DIGITS:
+        value, low = divmod(value, 10 ** _CHUNK_DIGITS)
+        chunks.append(str(low).zfill(_CHUNK_DIGITS))
+    chunks.append(str(value))
+    return tuple(c - 48 for c in ''.join(reversed(chunks)).encode())
+
+
+def _pad(digits: tuple[int, ...], width: int) -> tuple[int, ...]:
+    """Left-pad with zeros to ``width``, as the digit-by-digit code did."""
+    if len(digits) >= width:
+        return digits
+    return (0,) * (width - len(digits)) + digits
+
+
+def scalar_digit_multiply(number: tuple[int, ...], digit: int) -> list[int]:
+    if not number:
+        return []
+    product = digits_to_int(number) * digit
+    return list(_pad(int_to_digits(product), len(number)))
+
+
+def long_sum(data: list[list[int]]) -> tuple[int, ...]:
+    width = max((len(row) for row in data), default=0)
+    if width == 0:
+        return ()
+    total = sum(digits_to_int(row) for row in data)
+    return _pad(int_to_digits(total), width)
+
+
+def long_multiply(num1: tuple[int, ...], num2: tuple[int, ...]) -> tuple[int, ...]:
+    """Long multiplication.
+
+    Equivalent to,
+
+        num1
+    x   num2
+    --------
+    ........
+    --------
+
+    Digits are converted to native ints for the arithmetic; the result
+    keeps the leading zeros the column-by-column method would produce.
+
+    :param num1:
+    :param num2:
+    :return:
+    """
+    if not num2:
+        return ()
+    product = digits_to_int(num1) * digits_to_int(num2)
+    width = len(num1) + len(num2) - 1
+    if product == 0:
+        return (0,) * width
+    return _pad(int_to_digits(product), width)
+
+
+def digit_matrix(numbers: list[tuple[int, ...]], width: int = None):
+    """Right-aligned (len(numbers), width) int64 array of digit tuples."""
+    if width is None:
+        width = max((len(n) for n in numbers), default=0)
+    matrix = np.zeros((len(numbers), width), dtype=np.int64)
+    for i, number in enumerate(numbers):
+        if number:
+            matrix[i, width - len(number):] = number
+    return matrix
+
+
+def _propagate_carries(matrix) -> None:
+    """Normalise every row to base-10 digits in place, right to left."""
+    carry = np.zeros(matrix.shape[0], dtype=np.int64)
+    for column in range(matrix.shape[1] - 1, -1, -1):
+        values = matrix[:, column] + carry
+        carry, matrix[:, column] = np.divmod(values, 10)
+
+
+def _matrix_rows(matrix, widths: list[int]) -> list[tuple[int, ...]]:
+    """Rows of ``matrix`` without leading zeros beyond each row's width."""
+    total = matrix.shape[1]
+    nonzero = matrix != 0
+    first = np.where(nonzero.any(axis=1), nonzero.argmax(axis=1), total)
+    return [tuple(row[min(start, total - width):].tolist())
+            for row, start, width in zip(matrix, first, widths)]
+
+
+def _use_numpy(numbers: list[tuple[int, ...]], use_numpy: bool | None):
+    if use_numpy is None:
+        return max((len(n) for n in numbers), default=0) >= NUMPY_MIN_DIGITS
+    return use_numpy
+
+
+def batch_long_multiply(numbers: list[tuple[int, ...]],
+                        multiplier: tuple[int, ...],
+                        use_numpy: bool = None) -> list[tuple[int, ...]]:
+    """``[long_multiply(n, multiplier) for n in numbers]``, in one pass.
+
+    With NumPy the digit vectors are stacked into one matrix, multiplied
+    column by column and carried for all rows at once. By default that is
+    only used once numbers reach ``NUMPY_MIN_DIGITS`` digits; below that
+    the native-int path is faster.
+    """
+    if not _use_numpy(numbers, use_numpy) or not multiplier:
+        return [long_multiply(n, multiplier) for n in numbers]
+    width = max((len(n) for n in numbers), default=0)
+    extra = len(multiplier) + 1
+    digits = digit_matrix(numbers, width)
+    product = np.zeros((len(numbers), width + extra), dtype=np.int64)
+    for shift, digit in enumerate(reversed(multiplier)):
+        if digit:
+            end = product.shape[1] - shift
+            product[:, end - width:end] += digits * digit
+    _propagate_carries(product)
+    return _matrix_rows(product, [len(n) + len(multiplier) - 1
+                                  for n in numbers])
+
+
+def batch_long_add(numbers: list[tuple[int, ...]],
+                   others: list[tuple[int, ...]],
+                   use_numpy: bool = None) -> list[tuple[int, ...]]:
+    """Pairwise ``long_sum([a, b])`` of two equally long lists."""
+    if len(numbers) != len(others):
+        raise ValueError('numbers and others must be the same length')
+    if not _use_numpy(numbers + others, use_numpy):
+        return [long_sum([list(a), list(b)]) for a, b in zip(numbers, others)]
+    width = max((len(n) for n in numbers + others), default=0)
+    total = np.zeros((len(numbers), width + 1), dtype=np.int64)
+    total[:, 1:] = digit_matrix(numbers, width) + digit_matrix(others, width)
+    _propagate_carries(total)
+    return _matrix_rows(total, [max(len(a), len(b))
+                                for a, b in zip(numbers, others)])
@@ -0,0 +1,66 @@
+import hashlib
+import inspect
+import os
+import pathlib
+import pickle
+import re
+from functools import wraps
+
+from .inputs import InputType, get_filepath
+
+
+def get_cache_dir() -> pathlib.Path:
+    return pathlib.Path(os.environ.get('AOC_CACHE_DIR', './.aoc_cache'))
+
+
+def file_digest(filepath: str | pathlib.Path) -> str:
+    with open(filepath, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def _short_hash(value) -> str:
+    return hashlib.sha256(repr(value).encode()).hexdigest()[:16]
+
+
+def cached_parse(version: int = 1):
+    """Cache what ``parser(input_type, ...)`` returns in a pickle on disk.
+
+    Entries are keyed by the parser's qualified name and a hash of its
+    source file and module, then the input type and extra arguments, then
+    ``version`` and the SHA-256 of the input file. A changed input or a
+    bumped ``version`` replaces the old entry. Set ``AOC_NO_CACHE`` to
+    bypass the cache and ``AOC_CACHE_DIR`` to move it from ``./.aoc_cache``.
+    """
+    def decorate(parser):
+        source = pathlib.Path(inspect.getfile(parser)).resolve()
+        name = re.sub(r'[^\w.]', '_', parser.__qualname__)
+        prefix = f'{name}-{_short_hash((str(source), parser.__module__))}'
+
+        @wraps(parser)
+        def wrap(input_type, *args, **kw):
+            if os.environ.get('AOC_NO_CACHE'):
+                return parser(input_type, *args, **kw)
+            filepath = get_filepath(InputType[input_type.name])
+            call_key = _short_hash((input_type.name, args,
+                                    sorted(kw.items())))
+            content_key = _short_hash((version, file_digest(filepath)))
+            directory = get_cache_dir()
+            cache_file = directory / f'{prefix}-{call_key}-{content_key}.pickle'
+            if cache_file.exists():
+                try:
+                    with open(cache_file, 'rb') as f:
+                        return pickle.load(f)
+                except (OSError, EOFError, pickle.UnpicklingError,
+                        AttributeError, ImportError):
+                    pass
+            result = parser(input_type, *args, **kw)
+            directory.mkdir(parents=True, exist_ok=True)
+            for stale in directory.glob(f'{prefix}-{call_key}-*.pickle'):
+                stale.unlink(missing_ok=True)
+            temporary = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(temporary, 'wb') as f:
+                pickle.dump(result, f, protocol=5)
+            os.replace(temporary, cache_file)
+            return result
+        return wrap
+    return decorate
@@ -0,0 +1,163 @@
+import pathlib
+import struct
+import sys
+import time
+import zlib
+
+from .geometry import Point
+from .grid import Grid
+
+
+def visualise(points: dict[Point, str], filepath: pathlib.Path = None,
+              print_: bool = False):
+    xmax = max({p.x for p in points})
+    ymax = max({p.y for p in points})
+    data = [['.' for __ in range(xmax)] for _ in range(ymax)]
+    for p, string in points.items():
+        if p.x < xmax and p.y < ymax:
+            data[p.y][p.x] = string
+    rows = [''.join(row) for row in data]
+    string = '\n'.join(rows)
+    if print_ is True:
+        print(string)
+    if filepath is not None:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(string)
+
+
+FRAMES_MAGIC = b'AOCFRAMES1'
+_HEADER = struct.Struct('<II')
+_RECORD = struct.Struct('<BI')
+_KEYFRAME = 0
+_DIFF = 1
+
+
+class FrameRecorder:
+    """Records an animation of a character map to one compressed file.
+
+    The recorder keeps a mutable frame buffer: callers set only the cells
+    that changed and call ``snapshot`` to append a frame. Frames are
+    stored as zlib-compressed diffs against the previous recorded frame,
+    with a full keyframe every ``keyframe_every`` frames. Only every
+    ``every``-th snapshot is written; changes in between are folded into
+    the next recorded diff. ``FramePlayer`` reads the file back.
+    """
+
+    def __init__(self, filepath: str | pathlib.Path, width: int, height: int,
+                 fill: str = '.', every: int = 1, keyframe_every: int = 100,
+                 level: int = 6):
+        self.filepath = pathlib.Path(filepath)
+        self.frame = Grid(width, height, fill)
+        self.every = every
+        self.keyframe_every = keyframe_every
+        self.level = level
+        self.snapshots = 0
+        self.frames = 0
+        self._recorded = None
+        self._dirty = set()
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.filepath, 'wb')
+        self.file.write(FRAMES_MAGIC + _HEADER.pack(width, height))
+
+    @classmethod
+    def from_rows(cls, filepath: str | pathlib.Path, rows: list[str],
+                  **kw) -> 'FrameRecorder':
+        recorder = cls(filepath, max(len(row) for row in rows), len(rows),
+                       **kw)
+        try:
+            for j, row in enumerate(rows):
+                for i, c in enumerate(row):
+                    recorder[(i, j)] = c
+        except BaseException:
+            recorder.close()
+            raise
+        return recorder
+
+    def __setitem__(self, key: 'Point | tuple[int, int]', char: str):
+        index = self.frame._index_of(key)
+        self.frame.cells[index] = self.frame.code(char)
+        self._dirty.add(index)
+
+    def update(self, changes: 'dict[Point, str]'):
+        for key, char in changes.items():
+            self[key] = char
+
+    def snapshot(self, label: str = '') -> bool:
+        """Append the current frame (if not skipped); True if written."""
+        self.snapshots += 1
+        if (self.snapshots - 1) % self.every != 0:
+            return False
+        label_bytes = label.encode('utf-8')
+        header = struct.pack('<H', len(label_bytes)) + label_bytes
+        cells = self.frame.cells
+        if self._recorded is None or self.frames % self.keyframe_every == 0:
+            kind = _KEYFRAME
+            payload = header + bytes(cells)
+            self._recorded = bytearray(cells)
+        else:
+            kind = _DIFF
+            recorded = self._recorded
+            indices = sorted(i for i in self._dirty
+                             if cells[i] != recorded[i])
+            codes = bytes(cells[i] for i in indices)
+            for i in indices:
+                recorded[i] = cells[i]
+            payload = (header
+                       + struct.pack(f'<I{len(indices)}I', len(indices),
+                                     *indices)
+                       + codes)
+        self._dirty.clear()
+        compressed = zlib.compress(payload, self.level)
+        self.file.write(_RECORD.pack(kind, len(compressed)) + compressed)
+        self.frames += 1
+        return True
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FramePlayer:
+    """Reads back the frames written by ``FrameRecorder``."""
+
+    def __init__(self, filepath: str | pathlib.Path):
+        self.filepath = pathlib.Path(filepath)
+
+    def __iter__(self):
+        """Yield ``(label, frame)`` pairs, with each frame as a string."""
+        with open(self.filepath, 'rb') as f:
+            if f.read(len(FRAMES_MAGIC)) != FRAMES_MAGIC:
+                raise ValueError(f'{self.filepath} is not a frames file')
+            width, height = _HEADER.unpack(f.read(_HEADER.size))
+            frame = Grid(width, height)
+            while record := f.read(_RECORD.size):
+                kind, length = _RECORD.unpack(record)
+                payload = zlib.decompress(f.read(length))
+                (label_length,) = struct.unpack_from('<H', payload)
+                offset = 2 + label_length
+                label = payload[2:offset].decode('utf-8')
+                if kind == _KEYFRAME:
+                    frame.cells[:] = payload[offset:]
+                else:
+                    (count,) = struct.unpack_from('<I', payload, offset)
+                    offset += 4
+                    indices = struct.unpack_from(f'<{count}I', payload,
+                                                 offset)
+                    codes = payload[offset + 4 * count:]
+                    for i, code in zip(indices, codes):
+                        frame.cells[i] = code
+                yield label, str(frame)
+
+    def play(self, delay: float = 0.05, clear: bool = True):
+        for label, frame in self:
+            if clear:
+                sys.stdout.write('\x1b[H\x1b[2J')
+            sys.stdout.write(f'{frame}\n{label}\n')
+            sys.stdout.flush()
+            time.sleep(delay)
@@ -0,0 +1,601 @@
+"""Synthetic puzzle inputs for scaling benchmarks.
+
+Each day has one generator, registered in ``GENERATORS``, that takes a
+``size`` scale factor and a ``random.Random`` and returns the text of an
+input file in the same format as the real puzzle input. ``size=1`` gives
+roughly puzzle-sized inputs; grids grow in area and lists in length, so
+``size=10``, ``100`` and ``1000`` give 10x, 100x and 1000x workloads.
+"""
+import itertools
+import math
+import pathlib
+import random
+import string
+from collections import deque
+from typing import Callable
+
+from .search import bfs
+
+Generator = Callable[[float, random.Random], str]
+
+# Days 01, 02, 04, 05, 07, 09, 10, 11 and 13 have parts that take no input
+# type (see ``aoc.runner.reads_input_file``) and open input.txt, and the
+# Rust days 03, 06 and 08 build input.txt into the binary, so all of them
+# ignore generated.txt. Write their generated input as input.txt
+# (``generate -o input.txt``), as ``aoc bench`` does in its copies of the
+# day directories.
+GENERATORS: dict[int, Generator] = {}
+DEFAULT_FILENAME = 'generated.txt'
+
+
+def register_generator(day: int):
+    def decorator(function: Generator) -> Generator:
+        GENERATORS[day] = function
+        return function
+    return decorator
+
+
+def generate_input(day: int, size: float = 1, seed: int = 0) -> str:
+    if day not in GENERATORS:
+        raise ValueError(f'no input generator for day {day}')
+    return GENERATORS[day](size, random.Random(seed))
+
+
+def write_input(day: int, directory: str | pathlib.Path, size: float = 1,
+                seed: int = 0, filename: str = DEFAULT_FILENAME
+                ) -> pathlib.Path:
+    """Write a generated input for ``day`` to ``directory/filename``."""
+    path = pathlib.Path(directory) / filename
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(generate_input(day, size, seed))
+    return path
+
+
+def _count(base: int, size: float) -> int:
+    return max(1, round(base * size))
+
+
+def _side(base: int, size: float, odd: bool = False) -> int:
+    """Side of a square grid with ``size`` times the area of a base one."""
+    side = max(5, round(base * math.sqrt(size)))
+    if odd and side % 2 == 0:
+        side += 1
+    return side
+
+
+def _join(rows) -> str:
+    return '\n'.join(rows) + '\n'
+
+
+def _unique_names(rng: random.Random, count: int, min_length: int = 2,
+                  alphabet: str = string.ascii_lowercase) -> list[str]:
+    length = min_length
+    while len(alphabet) ** length < count:
+        length += 1
+    names = []
+    for value in rng.sample(range(len(alphabet) ** length), count):
+        letters = []
+        for _ in range(length):
+            value, i = divmod(value, len(alphabet))
+            letters.append(alphabet[i])
+        names.append(''.join(letters))
+    return names
+
+
+def _maze(side: int, rng: random.Random) -> list[list[str]]:
+    """A perfect maze on the odd cells of a ``side`` x ``side`` grid."""
+    rows = [['#'] * side for _ in range(side)]
+    start = (1, 1)
+    rows[1][1] = '.'
+    stack = [start]
+    while stack:
+        i, j = stack[-1]
+        options = [(i + di, j + dj) for di, dj in ((2, 0), (-2, 0), (0, 2),
+                                                   (0, -2))
+                   if 0 < i + di < side - 1 and 0 < j + dj < side - 1
+                   and rows[j + dj][i + di] == '#']
+        if not options:
+            stack.pop()
+            continue
+        ni, nj = rng.choice(options)
+        rows[(j + nj) // 2][(i + ni) // 2] = '.'
+        rows[nj][ni] = '.'
+        stack.append((ni, nj))
+    return rows
+
+
+@register_generator(1)
+def location_lists(size: float, rng: random.Random) -> str:
+    count = _count(1000, size)
+    left = [rng.randint(10000, 99999) for _ in range(count)]
+    right = [rng.choice(left) if rng.random() < 0.3
+             else rng.randint(10000, 99999) for _ in range(count)]
+    return _join(f'{a}   {b}' for a, b in zip(left, right))
+
+
+@register_generator(2)
+def reports(size: float, rng: random.Random) -> str:
+    rows = []
+    for _ in range(_count(1000, size)):
+        sign = rng.choice((1, -1))
+        levels = [rng.randint(30, 70)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + sign * rng.randint(1, 3))
+        for _ in range(rng.choice((0, 0, 1, 1, 2))):
+            i = rng.randrange(len(levels))
+            levels[i] += rng.choice((-5, -3, 0, 3, 5))
+        rows.append(' '.join(str(max(1, level)) for level in levels))
+    return _join(rows)
+
+
+@register_generator(3)
+def corrupted_memory(size: float, rng: random.Random) -> str:
+    noise = "!@#$%^&*()[]{}<>,;:'?+-_ whowhatwhenwhereselectfromhowwhy"
+
+    def fragment():
+        a, b = rng.randint(1, 999), rng.randint(1, 999)
+        match rng.randrange(10):
+            case 0 | 1 | 2:
+                return f'mul({a},{b})'
+            case 3:
+                return rng.choice(("do()", "don't()"))
+            case 4:
+                return rng.choice((f'mul({a},{b}]', f'mul ({a},{b})',
+                                   f'mul({a}*{b})', f'mul[{a},{b})',
+                                   f'mul({a},{b}'))
+            case _:
+                return ''.join(rng.choices(noise, k=rng.randint(1, 8)))
+
+    rows = []
+    for _ in range(_count(6, size)):
+        row = []
+        length = 0
+        while length < 3000:
+            row.append(fragment())
+            length += len(row[-1])
+        rows.append(''.join(row))
+    return _join(rows)
+
+
+@register_generator(4)
+def word_search(size: float, rng: random.Random) -> str:
+    side = _side(140, size)
+    rows = [rng.choices('XMAS', k=side) for _ in range(side)]
+    for _ in range(side * side // 16):
+        di, dj = rng.choice([(di, dj) for di in (-1, 0, 1)
+                             for dj in (-1, 0, 1) if di or dj])
+        i, j = rng.randrange(side), rng.randrange(side)
+        if 0 <= i + 3 * di < side and 0 <= j + 3 * dj < side:
+            for k, c in enumerate('XMAS'):
+                rows[j + k * dj][i + k * di] = c
+    return _join(''.join(row) for row in rows)
+
+
+@register_generator(5)
+def print_queue(size: float, rng: random.Random) -> str:
+    pages = rng.sample(range(10, 100), 49)
+    rules = [f'{a}|{b}' for n, a in enumerate(pages) for b in pages[n + 1:]]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(_count(200, size)):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(','.join(str(p) for p in update))
+    return _join(rules + [''] + updates)
+
+
+@register_generator(6)
+def guard_map(size: float, rng: random.Random) -> str:
+    side = _side(130, size)
+    while True:
+        rows = [['#' if rng.random() < 0.05 else '.' for _ in range(side)]
+                for _ in range(side)]
+        i, j = rng.randrange(side), rng.randrange(side)
+        rows[j][i] = '^'
+        if _guard_leaves(rows, i, j):
+            return _join(''.join(row) for row in rows)
+
+
+def _guard_leaves(rows: list[list[str]], i: int, j: int) -> bool:
+    di, dj = 0, -1
+    seen = set()
+    while 0 <= i < len(rows[0]) and 0 <= j < len(rows):
+        if (i, j, di, dj) in seen:
+            return False
+        seen.add((i, j, di, dj))
+        ni, nj = i + di, j + dj
+        if 0 <= ni < len(rows[0]) and 0 <= nj < len(rows) \
+                and rows[nj][ni] == '#':
+            di, dj = -dj, di
+        else:
+            i, j = ni, nj
+    return True
+
+
+@register_generator(7)
+def calibrations(size: float, rng: random.Random) -> str:
+    rows = []
+    while len(rows) < _count(850, size):
+        numbers = [rng.randint(1, 99) if rng.random() < 0.8
+                   else rng.randint(100, 999)
+                   for _ in range(rng.randint(3, 12))]
+        result = numbers[0]
+        for n in numbers[1:]:
+            match rng.randrange(3):
+                case 0:
+                    result += n
+                case 1:
+                    result *= n
+                case 2:
+                    result = int(f'{result}{n}')
+        if result >= 10 ** 15:
+            continue
+        if rng.random() < 0.4:
+            result += rng.randint(1, 99)
+        rows.append(f'{result}: ' + ' '.join(str(n) for n in numbers))
+    return _join(rows)
+
+
+@register_generator(8)
+def antenna_map(size: float, rng: random.Random) -> str:
+    side = _side(50, size)
+    frequencies = string.digits + string.ascii_letters
+    rows = [['.'] * side for _ in range(side)]
+    for _ in range(side * side // 12):
+        rows[rng.randrange(side)][rng.randrange(side)] = rng.choice(
+            frequencies)
+    return _join(''.join(row) for row in rows)
+
+
+@register_generator(9)
+def disk_map(size: float, rng: random.Random) -> str:
+    files = _count(10000, size)
+    digits = []
+    for n in range(files):
+        digits.append(str(rng.randint(1, 9)))
+        if n < files - 1:
+            digits.append(str(rng.randint(0, 9)))
+    return ''.join(digits) + '\n'
+
+
+@register_generator(10)
+def topographic_map(size: float, rng: random.Random) -> str:
+    side = _side(50, size)
+    distances = [[None] * side for _ in range(side)]
+    queue = deque()
+    for _ in range(max(1, side * side // 100)):
+        i, j = rng.randrange(side), rng.randrange(side)
+        distances[j][i] = 0
+        queue.append((i, j))
+    while queue:
+        i, j = queue.popleft()
+        for ni, nj in ((i + 1, j), (i - 1, j), (i, j + 1), (i, j - 1)):
+            if 0 <= ni < side and 0 <= nj < side \
+                    and distances[nj][ni] is None:
+                distances[nj][ni] = distances[j][i] + 1
+                queue.append((ni, nj))
+    return _join(''.join(str(rng.randrange(10)) if rng.random() < 0.05
+                         else str(d % 10) for d in row) for row in distances)
+
+
+@register_generator(11)
+def stones(size: float, rng: random.Random) -> str:
+    return ' '.join(str(rng.randint(0, 10 ** rng.randint(1, 7)))
+                    for _ in range(_count(8, size))) + '\n'
+
+
+@register_generator(12)
+def garden(size: float, rng: random.Random) -> str:
+    side = _side(140, size)
+    block = 6
+    coarse = [rng.choices(string.ascii_uppercase, k=side // block + 1)
+              for _ in range(side // block + 1)]
+    rows = []
+    for j in range(side):
+        row = []
+        for i in range(side):
+            ci = min(max((i + rng.randint(-1, 1)) // block, 0),
+                     len(coarse) - 1)
+            cj = min(max((j + rng.randint(-1, 1)) // block, 0),
+                     len(coarse) - 1)
+            row.append(coarse[cj][ci])
+        rows.append(''.join(row))
+    return _join(rows)
+
+
+@register_generator(13)
+def claw_machines(size: float, rng: random.Random) -> str:
+    records = []
+    for _ in range(_count(320, size)):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        if rng.random() < 0.5:
+            a, b = rng.randint(1, 100), rng.randint(1, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        records.append(f'Button A: X+{ax}, Y+{ay}\n'
+                       f'Button B: X+{bx}, Y+{by}\n'
+                       f'Prize: X={px}, Y={py}\n')
+    return '\n'.join(records)
+
+
+# Day 14 divides by the size of each step, so no velocity is ever 0.
+_ROBOT_VELOCITIES = [*range(-99, 0), *range(1, 100)]
+
+
+@register_generator(14)
+def robots(size: float, rng: random.Random) -> str:
+    return _join(f'p={rng.randrange(101)},{rng.randrange(103)} '
+                 f'v={rng.choice(_ROBOT_VELOCITIES)},'
+                 f'{rng.choice(_ROBOT_VELOCITIES)}'
+                 for _ in range(_count(500, size)))
+
+
+@register_generator(15)
+def warehouse(size: float, rng: random.Random) -> str:
+    side = _side(50, size)
+    rows = [['#'] * side]
+    for _ in range(side - 2):
+        rows.append(['#'] + rng.choices('.O#', weights=(70, 25, 5),
+                                        k=side - 2) + ['#'])
+    rows.append(['#'] * side)
+    rows[side // 2][side // 2] = '@'
+    moves = ''.join(rng.choices('<>^v', k=_count(20000, size)))
+    return _join([''.join(row) for row in rows] + ['']
+                 + [moves[i:i + 1000] for i in range(0, len(moves), 1000)])
+
+
+@register_generator(16)
+def reindeer_maze(size: float, rng: random.Random) -> str:
+    side = _side(141, size, odd=True)
+    rows = _maze(side, rng)
+    for _ in range(side * side // 50):
+        i, j = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        if (i + j) % 2 == 1:
+            rows[j][i] = '.'
+    rows[side - 2][1] = 'S'
+    rows[1][side - 2] = 'E'
+    return _join(''.join(row) for row in rows)
+
+
+def _run_program(program: list[int], a: int) -> list[int]:
+    b = c = ip = 0
+    output = []
+    while ip < len(program):
+        opcode, operand = program[ip], program[ip + 1]
+        combo = (0, 1, 2, 3, a, b, c, None)[operand]
+        match opcode:
+            case 0:
+                a >>= combo
+            case 1:
+                b ^= operand
+            case 2:
+                b = combo % 8
+            case 3:
+                if a:
+                    ip = operand
+                    continue
+            case 4:
+                b ^= c
+            case 5:
+                output.append(combo % 8)
+            case 6:
+                b = a >> combo
+            case 7:
+                c = a >> combo
+        ip += 2
+    return output
+
+
+def _finds_quine(program: list[int], a: int, limit: int = 64) -> bool:
+    """Whether the day's digit-by-digit search for a quine A terminates.
+
+    The search starts from the output for register ``a`` and fixes the
+    octal digits of A from the most significant end, each to the smallest
+    value making the tail of the output match the program. It never
+    backtracks, so only inputs it solves are worth generating.
+    """
+    n = len(program)
+    coefficients = [0] * (n + 1)
+    output = _run_program(program, a)
+    index = 0
+    while output != program:
+        if index > n:
+            return False
+        value = 0
+        while output[::-1][:index] != program[::-1][:index]:
+            if value == limit:
+                return False
+            coefficients[index] = value
+            candidate = sum(c * 8 ** i
+                            for i, c in enumerate(reversed(coefficients)))
+            output = _run_program(program, candidate)
+            value += 1
+        index += 1
+    return True
+
+
+@register_generator(17)
+def computer_program(size: float, rng: random.Random) -> str:
+    while True:
+        a = rng.getrandbits(max(3, round(48 * size))) | 1
+        middle = [[1, rng.randrange(8)], [4, rng.randrange(8)]]
+        rng.shuffle(middle)
+        program = [2, 4, 1, rng.randrange(8), 7, 5, *middle[0], *middle[1],
+                   5, 5, 0, 3, 3, 0]
+        if _finds_quine(program, a):
+            break
+    return (f'Register A: {a}\nRegister B: 0\nRegister C: 0\n\n'
+            f'Program: {",".join(str(n) for n in program)}\n')
+
+
+@register_generator(18)
+def falling_bytes(size: float, rng: random.Random) -> str:
+    # The solutions always drop 1024 bytes before searching, so the grid
+    # never shrinks below the puzzle's 71 x 71 and those bytes must leave
+    # a way through.
+    side = max(71, _side(71, size))
+    end = (side - 1, side - 1)
+    cells = [(x, y) for y in range(side) for x in range(side)
+             if (x, y) not in ((0, 0), end)]
+
+    def neighbors(cell):
+        x, y = cell
+        return [n for n in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1))
+                if 0 <= n[0] < side and 0 <= n[1] < side
+                and n not in fallen]
+
+    while True:
+        rng.shuffle(cells)
+        # The exit is taken from the largest coordinates, so both must
+        # appear.
+        cells.remove((side - 1, 0))
+        cells.remove((0, side - 1))
+        cells[:0] = [(side - 1, 0), (0, side - 1)]
+        fallen = set(cells[:1024])
+        if bfs((0, 0), neighbors, is_goal=lambda c: c == end).found:
+            break
+    return _join(f'{x},{y}' for x, y in cells[:round(0.68 * len(cells))])
+
+
+@register_generator(19)
+def towels(size: float, rng: random.Random) -> str:
+    patterns = set()
+    while len(patterns) < 447:
+        patterns.add(''.join(rng.choices('wubrg', k=rng.randint(1, 8))))
+    patterns.discard(rng.choice('wubrg'))
+    patterns = sorted(patterns)
+    designs = []
+    for _ in range(_count(400, size)):
+        design = ''
+        while len(design) < rng.randint(20, 60):
+            design += rng.choice(patterns)
+        if rng.random() < 0.3:
+            i = rng.randrange(len(design))
+            design = design[:i] + rng.choice('wubrg') + design[i + 1:]
+        designs.append(design)
+    return _join([', '.join(patterns), ''] + designs)
+
+
+@register_generator(20)
+def racetrack(size: float, rng: random.Random) -> str:
+    side = _side(141, size, odd=True)
+    maze = _maze(side, rng)
+    start = (1, side - 2)
+    end = (rng.randrange(1, side - 1, 2), rng.randrange(1, side - 1, 2))
+    previous = {start: None}
+    queue = deque([start])
+    while queue:
+        i, j = queue.popleft()
+        for n in ((i + 1, j), (i - 1, j), (i, j + 1), (i, j - 1)):
+            if maze[n[1]][n[0]] == '.' and n not in previous:
+                previous[n] = (i, j)
+                queue.append(n)
+    rows = [['#'] * side for _ in range(side)]
+    node = end
+    while node is not None:
+        rows[node[1]][node[0]] = '.'
+        node = previous[node]
+    rows[start[1]][start[0]] = 'S'
+    rows[end[1]][end[0]] = 'E'
+    return _join(''.join(row) for row in rows)
+
+
+# The numeric keypad moves day 21 has routes for, in its NUMPAD_ROUTES.
+_DOOR_MOVES = {
+    'A9', '96', '65', '5A', 'A1', '14', '43', '3A', 'A5', '52', '28', '8A',
+    'A6', '67', '70', '0A', '97', '73', 'A0', '02', '29', '9A', '98', '80',
+    '17', '79', 'A4', '45', '56', '6A', 'A3', '37',
+}
+
+
+def _door_code_choices() -> list[str]:
+    """Codes whose every move, from A and back to A, has a route."""
+    codes = []
+    for digits in itertools.product(string.digits, repeat=3):
+        keys = ('A', *digits, 'A')
+        if all(a + b in _DOOR_MOVES for a, b in zip(keys, keys[1:])):
+            codes.append(''.join(digits) + 'A')
+    return codes
+
+
+@register_generator(21)
+def door_codes(size: float, rng: random.Random) -> str:
+    return _join(rng.choices(_door_code_choices(), k=_count(5, size)))
+
+
+@register_generator(22)
+def secrets(size: float, rng: random.Random) -> str:
+    return _join(str(rng.randrange(1, 1 << 24))
+                 for _ in range(_count(2000, size)))
+
+
+@register_generator(23)
+def lan_party(size: float, rng: random.Random) -> str:
+    count = _count(520, size)
+    names = _unique_names(rng, count)
+    edges = set()
+    while len(edges) < count * 13 // 2:
+        a, b = rng.sample(names, 2)
+        edges.add((min(a, b), max(a, b)))
+    party = sorted(rng.sample(names, 13))
+    edges.update((a, b) for n, a in enumerate(party) for b in party[n + 1:])
+    edges = [rng.choice((f'{a}-{b}', f'{b}-{a}')) for a, b in edges]
+    rng.shuffle(edges)
+    return _join(edges)
+
+
+@register_generator(24)
+def circuit(size: float, rng: random.Random) -> str:
+    """A ripple-carry adder with four pairs of swapped gate outputs."""
+    bits = max(5, round(45 * size))
+    width = max(2, len(str(bits)))
+    x = [f'x{i:0{width}d}' for i in range(bits)]
+    y = [f'y{i:0{width}d}' for i in range(bits)]
+    z = [f'z{i:0{width}d}' for i in range(bits + 1)]
+    names = iter(_unique_names(rng, 5 * bits, min_length=3,
+                               alphabet='abcdefghijklmnopqrstuvw'))
+    gates = [[x[0], 'XOR', y[0], z[0]]]
+    carry = next(names)
+    gates.append([x[0], 'AND', y[0], carry])
+    swappable = []
+    for i in range(1, bits):
+        half_sum, half_carry, both = next(names), next(names), next(names)
+        out = z[bits] if i == bits - 1 else next(names)
+        adder = [[x[i], 'XOR', y[i], half_sum],
+                 [x[i], 'AND', y[i], half_carry],
+                 [half_sum, 'XOR', carry, z[i]],
+                 [half_sum, 'AND', carry, both],
+                 [half_carry, 'OR', both, out]]
+        if i < bits - 1:
+            swappable.append([(adder[0], adder[1]), (adder[2], adder[4]),
+                              (adder[2], adder[3])])
+        gates.extend(adder)
+        carry = out
+    for options in rng.sample(swappable, min(4, len(swappable))):
+        first, second = rng.choice(options)
+        first[3], second[3] = second[3], first[3]
+    rng.shuffle(gates)
+    values = [f'{name}: {rng.randint(0, 1)}' for name in x + y]
+    connections = []
+    for a, op, b, out in gates:
+        if rng.random() < 0.5:
+            a, b = b, a
+        connections.append(f'{a} {op} {b} -> {out}')
+    return _join(values + [''] + connections)
+
+
+@register_generator(25)
+def schematics(size: float, rng: random.Random) -> str:
+    records = []
+    for _ in range(_count(500, size)):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        rows = [''.join('#' if j >= 5 - h else '.' for h in heights)
+                for j in range(5)]
+        if rng.random() < 0.5:
+            rows = ['#####'] + rows[::-1] + ['.....']
+        else:
+            rows = ['.....'] + rows + ['#####']
+        records.append('\n'.join(rows) + '\n')
+    return '\n'.join(records)
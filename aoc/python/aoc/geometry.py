@@ -0,0 +1,325 @@
+import functools
+import math
+from dataclasses import FrozenInstanceError
+from enum import Enum
+
+from .lazy import lazy_import
+
+np = lazy_import('numpy')
+
+
+class _Compass:
+    """Table-driven turns and steps shared by ``Direction`` and ``Direction8``.
+
+    Each member has an integer ``code`` counting clockwise from north and a
+    unit step ``dx``/``dy`` (y grows southwards). Turning is a lookup in the
+    class's ``clockwise``/``anticlockwise``/``opposite`` code tables, and
+    ``move`` steps whole arrays of positions at once.
+    """
+    def rotate_clockwise(self):
+        return self.by_code[self.clockwise[self.code]]
+
+    def rotate_anticlockwise(self):
+        return self.by_code[self.anticlockwise[self.code]]
+
+    @property
+    def reverse(self):
+        return self.by_code[self.opposite[self.code]]
+
+    def turn(self, steps: int):
+        """Turn ``steps`` codes clockwise (negative for anticlockwise)."""
+        return self.by_code[(self.code + steps) % len(self.by_code)]
+
+    @classmethod
+    def from_code(cls, code: int):
+        return cls.by_code[code]
+
+    @classmethod
+    def codes(cls, directions) -> 'np.ndarray':
+        """Integer code array for an iterable of members."""
+        return np.fromiter((d.code for d in directions), dtype=np.int64)
+
+    @classmethod
+    def offset_array(cls) -> 'np.ndarray':
+        """Read-only (n, 2) array of (dx, dy), indexed by code."""
+        return _offset_array(cls)
+
+    @classmethod
+    def move(cls, positions, directions, steps=1) -> 'np.ndarray':
+        """Step an (m, 2) array of (x, y) by an array of direction codes.
+
+        ``steps`` may be a scalar or one step count per position.
+        """
+        offsets = cls.offset_array()[np.asarray(directions)]
+        return np.asarray(positions) + offsets * np.asarray(steps)[..., None]
+
+    @classmethod
+    def rotate(cls, directions, quarter_turns: int = 1) -> 'np.ndarray':
+        """Turn an array of direction codes clockwise by quarter turns."""
+        n = len(cls.by_code)
+        return (np.asarray(directions) + quarter_turns * (n // 4)) % n
+
+
+def _build_compass(cls, clockwise_order: tuple[str, ...],
+                   steps: tuple[tuple[int, int], ...]):
+    n = len(clockwise_order)
+    cls.by_code = tuple(cls[name] for name in clockwise_order)
+    cls.dx_table = tuple(dx for dx, _ in steps)
+    cls.dy_table = tuple(dy for _, dy in steps)
+    cls.clockwise = tuple((c + n // 4) % n for c in range(n))
+    cls.anticlockwise = tuple((c - n // 4) % n for c in range(n))
+    cls.opposite = tuple((c + n // 2) % n for c in range(n))
+    for code, (member, (dx, dy)) in enumerate(zip(cls.by_code, steps)):
+        member.code = code
+        member.dx = dx
+        member.dy = dy
+
+
+@functools.cache
+def _offset_array(cls):
+    array = np.array([cls.dx_table, cls.dy_table], dtype=np.int64).T.copy()
+    array.flags.writeable = False
+    return array
+
+
+class Direction(_Compass, Enum):
+    N = 1
+    E = 2
+    W = 3
+    S = 4
+
+
+_build_compass(Direction, ('N', 'E', 'S', 'W'),
+               ((0, -1), (1, 0), (0, 1), (-1, 0)))
+
+
+class Direction8(_Compass, Enum):
+    N = 0
+    NE = 1
+    E = 2
+    SE = 3
+    S = 4
+    SW = 5
+    W = 6
+    NW = 7
+
+
+_build_compass(Direction8, ('N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW'),
+               ((0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0),
+                (-1, -1)))
+
+
+class _Coordinate:
+    """Immutable (x, y) pair with slots and a hash computed once.
+
+    Repr, equality and hash match a ``@dataclass(frozen=True)`` with the
+    same fields, but there is no per-instance ``__dict__`` and both fields
+    are not re-hashed on every set/dict lookup.
+    """
+    __slots__ = ('x', 'y', '_hash')
+
+    def __init__(self, x: int, y: int):
+        _set_x(self, x)
+        _set_y(self, y)
+        _set_hash(self, hash((x, y)))
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f'cannot assign to field {name!r}')
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f'cannot delete field {name!r}')
+
+    def __reduce__(self):
+        return self.__class__, (self.x, self.y)
+
+    def __repr__(self):
+        return f'{self.__class__.__qualname__}(x={self.x!r}, y={self.y!r})'
+
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return self.x == other.x and self.y == other.y
+        return NotImplemented
+
+    def __hash__(self):
+        return self._hash
+
+
+# The slots' own setters get past the frozen __setattr__ more cheaply
+# than object.__setattr__, which looks each name up again.
+_set_x = _Coordinate.x.__set__
+_set_y = _Coordinate.y.__set__
+_set_hash = _Coordinate._hash.__set__
+
+
+class Point(_Coordinate):
+    __slots__ = ()
+
+    def diff(self, other: 'Point'):
+        return Point(self.x - other.x, self.y - other.y)
+
+    @property
+    def length(self):
+        return abs(self.x) + abs(self.y)
+
+    def point_in_direction(self, direction: 'Direction | Direction8',
+                           steps: int = 1) -> 'Point':
+        return self.__class__(self.x + direction.dx * steps,
+                              self.y + direction.dy * steps)
+
+    @property
+    def size(self):
+        return int(math.sqrt(self.x**2 + self.y**2))
+
+    @property
+    def immediate_neighbors(self):
+        return {Point(self.x, self.y-1),
+                Point(self.x, self.y+1),
+                Point(self.x-1, self.y),
+                Point(self.x+1, self.y)}
+
+    def immediate_neighbors_after(self, steps: int):
+        """Points reachable in exactly ``steps`` unit moves (revisits allowed).
+
+        That is every point whose distance is at most ``steps`` and has the
+        same parity as ``steps``.
+        """
+        x, y = self.x, self.y
+        return {Point(x + dx, y + dy)
+                for radius in range(steps % 2, steps + 1, 2)
+                for dx, dy in manhattan_offsets(radius)}
+
+    def points_at_distance(self, radius: int):
+        x, y = self.x, self.y
+        for dx, dy in manhattan_offsets(radius):
+            yield Point(x + dx, y + dy)
+
+    def points_within_distance(self, radius: int):
+        x, y = self.x, self.y
+        for dx, dy in manhattan_offsets(radius, exact=False):
+            yield Point(x + dx, y + dy)
+
+    @property
+    def diagonal_neighbors(self):
+        return {Point(self.x + 1, self.y - 1),
+                Point(self.x + 1, self.y + 1),
+                Point(self.x - 1, self.y - 1),
+                Point(self.x - 1, self.y + 1)}
+
+    @property
+    def all_neighbors(self):
+        new = set()
+        new.update(self.immediate_neighbors)
+        new.update(self.diagonal_neighbors)
+        return new
+
+
+@functools.cache
+def manhattan_offsets(radius: int,
+                      exact: bool = True) -> tuple[tuple[int, int], ...]:
+    """(dx, dy) offsets at exactly ``radius``, or within it if not exact."""
+    if not exact:
+        return tuple(offset for r in range(radius + 1)
+                     for offset in manhattan_offsets(r))
+    if radius == 0:
+        return (0, 0),
+    offsets = []
+    for dx in range(-radius, radius + 1):
+        dy = radius - abs(dx)
+        offsets.append((dx, dy))
+        if dy != 0:
+            offsets.append((dx, -dy))
+    return tuple(offsets)
+
+
+@functools.cache
+def manhattan_offset_array(radius: int, exact: bool = True):
+    """Read-only (n, 2) NumPy array of ``manhattan_offsets(radius, exact)``."""
+    array = np.array(manhattan_offsets(radius, exact), dtype=np.int64)
+    array.flags.writeable = False
+    return array
+
+
+class PointCodec:
+    """Packs points on a ``width``-wide map into ``y * width + x`` ints.
+
+    Hot loops can keep coordinates as plain ints (cheap to hash, compare
+    and store) and only go back to ``Point`` at the edges.
+    """
+    __slots__ = ('width', 'height')
+
+    def __init__(self, width: int, height: int = None):
+        self.width = width
+        self.height = height
+
+    def pack(self, point: Point) -> int:
+        return point.y * self.width + point.x
+
+    def pack_xy(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def unpack(self, code: int) -> Point:
+        y, x = divmod(code, self.width)
+        return Point(x, y)
+
+    def unpack_xy(self, code: int) -> tuple[int, int]:
+        y, x = divmod(code, self.width)
+        return x, y
+
+    def offset(self, direction: 'Direction | Direction8') -> int:
+        return direction.dy * self.width + direction.dx
+
+    def in_bounds(self, code: int) -> bool:
+        if self.height is None:
+            return code >= 0
+        return 0 <= code < self.width * self.height
+
+    def immediate_neighbors(self, code: int) -> tuple[int, int, int, int]:
+        """N, E, S, W neighbours, without any wrap-around or bounds checks."""
+        width = self.width
+        return code - width, code + 1, code + width, code - 1
+
+
+class Vector(_Coordinate):
+    __slots__ = ()
+
+    @classmethod
+    def zero(cls):
+        return cls(0, 0)
+
+    def __eq__(self, other):
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self):
+        return self._hash
+
+    def __add__(self, other):
+        return Vector(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other):
+        return Vector(self.x - other.x, self.y - other.y)
+
+    def __rsub__(self, other):
+        return Vector(other.x - self.x, other.y - self.y)
+
+    def __radd__(self, other):
+        return Vector(self.x + other.x, self.y + other.y)
+
+    def __mul__(self, other: 'int | Vector'):
+        if isinstance(other, int):
+            return Vector(self.x * other, self.y * other)
+        else:
+            raise NotImplementedError
+
+    def __mod__(self, other: 'int | Vector'):
+        if isinstance(other, int):
+            return Vector(self.x % other, self.y % other)
+        else:
+            return Vector(self.x % other.x, self.y % other.y)
+
+    def greatest_common_divisor(self, other: 'int | Vector'):
+        if isinstance(other, int):
+            return Vector(math.gcd(self.x, other),
+                          math.gcd(self.y, other))
+        else:
+            return Vector(math.gcd(self.x, other.x),
+                          math.gcd(self.y, other.y))
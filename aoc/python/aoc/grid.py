@@ -0,0 +1,394 @@
+from .geometry import Point, PointCodec
+from .lazy import lazy_import
+
+np = lazy_import('numpy')
+
+# Below this fraction of non-background cells a sparse grid is smaller
+# and faster to build than a dense one.
+SPARSE_THRESHOLD = 0.1
+
+GridKey = 'Point | tuple[int, int]'
+
+
+class _GridBase:
+    """Coordinate handling shared by the dense and sparse grids.
+
+    Subclasses store integer cell codes in ``cells``, indexed by the flat
+    index ``y * width + x``; cells holding ``fill`` count as empty. A grid
+    with no ``fill`` has no empty cells.
+    """
+    __slots__ = ()
+
+    @staticmethod
+    def _check_fill(fill: str | None, legend: dict[str, int] | None):
+        if fill is not None and legend is not None and fill not in legend:
+            raise ValueError(f'fill {fill!r} is not in the legend; pass a '
+                             f'fill from the legend or fill=None')
+
+    def code(self, char: str) -> int:
+        if self.legend is None:
+            return ord(char)
+        return self.legend[char]
+
+    def char(self, code: int) -> str:
+        if self._chars is None:
+            return chr(code)
+        return self._chars[code]
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def coords(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def point(self, index: int) -> Point:
+        y, x = divmod(index, self.width)
+        return Point(x, y)
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    @property
+    def codec(self) -> PointCodec:
+        return PointCodec(self.width, self.height)
+
+    def _index_of(self, key: GridKey) -> int:
+        if isinstance(key, tuple):
+            x, y = key
+        else:
+            x, y = key.x, key.y
+        if not self.in_bounds(x, y):
+            raise IndexError(f'({x}, {y}) is outside the '
+                             f'{self.width}x{self.height} grid')
+        return y * self.width + x
+
+    def __len__(self):
+        return self.width * self.height
+
+    def __contains__(self, key: GridKey) -> bool:
+        if isinstance(key, tuple):
+            return self.in_bounds(*key)
+        return self.in_bounds(key.x, key.y)
+
+    def __getitem__(self, key: GridKey) -> str:
+        return self.char(self.cells[self._index_of(key)])
+
+    def get(self, key: GridKey, default: str = None):
+        if key not in self:
+            return default
+        return self[key]
+
+    @property
+    def occupancy(self) -> float:
+        """Fraction of the cells that are not ``fill``."""
+        return self.occupied / len(self) if len(self) else 0.
+
+    @property
+    def offsets(self) -> tuple[int, int, int, int]:
+        """Flat-index offsets to the N, E, S and W neighbours."""
+        return -self.width, 1, self.width, -1
+
+    def neighbor_indices(self, index: int) -> list[int]:
+        """In-bounds flat indices of the four immediate neighbours."""
+        y, x = divmod(index, self.width)
+        result = []
+        if y > 0:
+            result.append(index - self.width)
+        if x < self.width - 1:
+            result.append(index + 1)
+        if y < self.height - 1:
+            result.append(index + self.width)
+        if x > 0:
+            result.append(index - 1)
+        return result
+
+    def points_of(self, char: str) -> set[Point]:
+        width = self.width
+        return {Point(i % width, i // width) for i in self.indices_of(char)}
+
+
+class Grid(_GridBase):
+    """Dense 2D map stored row-major in one contiguous bytearray.
+
+    The cell at (x, y) lives at index ``y * width + x`` of ``cells``. Each
+    cell holds a small integer code; by default that is the ASCII code of
+    the character it was parsed from, but a ``legend`` can map characters
+    to any codes in range(256).
+    """
+    __slots__ = ('width', 'height', 'cells', 'legend', '_chars', 'fill')
+
+    def __init__(self, width: int, height: int, fill: str | None = '.',
+                 legend: dict[str, int] = None):
+        self._check_fill(fill, legend)
+        self.width = width
+        self.height = height
+        self.legend = legend
+        self.fill = fill
+        self._chars = None
+        if legend is not None:
+            self._chars = {code: c for c, code in legend.items()}
+        code = 0 if fill is None else self.code(fill)
+        self.cells = bytearray([code]) * (width * height)
+
+    @classmethod
+    def from_rows(cls, rows: list[str], legend: dict[str, int] = None,
+                  fill: str | None = '.'):
+        cls._check_fill(fill, legend)
+        while rows and not rows[-1]:
+            rows = rows[:-1]
+        width = len(rows[0]) if rows else 0
+        grid = cls(width, len(rows), fill=None, legend=legend)
+        grid.fill = fill
+        for j, row in enumerate(rows):
+            if len(row) != width:
+                raise ValueError(f'Row {j} has length {len(row)}, '
+                                 f'expected {width}')
+            start = j * width
+            if legend is None:
+                grid.cells[start:start + width] = row.encode('ascii')
+            else:
+                grid.cells[start:start + width] = bytes(legend[c] for c in row)
+        return grid
+
+    def __setitem__(self, key: GridKey, char: str):
+        self.cells[self._index_of(key)] = self.code(char)
+
+    def row(self, y: int) -> memoryview:
+        start = y * self.width
+        return memoryview(self.cells)[start:start + self.width]
+
+    def column(self, x: int) -> memoryview:
+        return memoryview(self.cells)[x::self.width]
+
+    @property
+    def occupied(self) -> int:
+        if self.fill is None:
+            return len(self.cells)
+        return len(self.cells) - self.cells.count(self.code(self.fill))
+
+    def indices_of(self, char: str) -> list[int]:
+        code = self.code(char)
+        cells = self.cells
+        result = []
+        i = cells.find(code)
+        while i != -1:
+            result.append(i)
+            i = cells.find(code, i + 1)
+        return result
+
+    def find(self, char: str) -> Point | None:
+        i = self.cells.find(self.code(char))
+        if i == -1:
+            return None
+        return self.point(i)
+
+    def count(self, char: str) -> int:
+        return self.cells.count(self.code(char))
+
+    def copy(self) -> 'Grid':
+        new = Grid.__new__(Grid)
+        new.width = self.width
+        new.height = self.height
+        new.legend = self.legend
+        new.fill = self.fill
+        new._chars = self._chars
+        new.cells = self.cells[:]
+        return new
+
+    def to_sparse(self) -> 'SparseGrid':
+        sparse = SparseGrid(self.width, self.height, self.fill, self.legend)
+        background = sparse.cells.background
+        sparse.cells.update((i, c) for i, c in enumerate(self.cells)
+                            if c != background)
+        return sparse
+
+    def to_numpy(self):
+        """Zero-copy (height, width) uint8 view of the cells."""
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(
+            self.height, self.width)
+
+    def __str__(self):
+        if self.legend is None:
+            text = self.cells.decode('ascii')
+        else:
+            text = ''.join(self.char(c) for c in self.cells)
+        return '\n'.join(text[j * self.width:(j + 1) * self.width]
+                         for j in range(self.height))
+
+
+class _SparseCells(dict):
+    """Flat index -> code, reading ``background`` for any missing index."""
+    __slots__ = ('background',)
+
+    def __init__(self, background: int):
+        super().__init__()
+        self.background = background
+
+    def __missing__(self, index: int) -> int:
+        return self.background
+
+
+class SparseGrid(_GridBase):
+    """Grid with the same API as ``Grid`` that only stores non-fill cells.
+
+    ``cells`` is a dict from flat index to code, so memory and build time
+    scale with the occupied cells rather than the area. Reading a missing
+    index through ``cells[i]`` gives the fill code, as for a dense grid,
+    so a sparse grid always needs a ``fill``.
+    """
+    __slots__ = ('width', 'height', 'cells', 'legend', '_chars', 'fill')
+
+    def __init__(self, width: int, height: int, fill: str = '.',
+                 legend: dict[str, int] = None):
+        if fill is None:
+            raise ValueError('a sparse grid needs a fill for its empty cells')
+        self._check_fill(fill, legend)
+        self.width = width
+        self.height = height
+        self.legend = legend
+        self.fill = fill
+        self._chars = None
+        if legend is not None:
+            self._chars = {code: c for c, code in legend.items()}
+        self.cells = _SparseCells(self.code(fill))
+
+    @classmethod
+    def from_rows(cls, rows: list[str], legend: dict[str, int] = None,
+                  fill: str = '.'):
+        if fill is None:
+            raise ValueError('a sparse grid needs a fill for its empty cells')
+        return Grid.from_rows(rows, legend, fill).to_sparse()
+
+    def __setitem__(self, key: GridKey, char: str):
+        index = self._index_of(key)
+        code = self.code(char)
+        if code == self.cells.background:
+            self.cells.pop(index, None)
+        else:
+            self.cells[index] = code
+
+    def row(self, y: int) -> memoryview:
+        start = y * self.width
+        cells = self.cells
+        return memoryview(bytearray(cells[i] for i in
+                                    range(start, start + self.width)))
+
+    def column(self, x: int) -> memoryview:
+        cells = self.cells
+        return memoryview(bytearray(cells[i] for i in
+                                    range(x, len(self), self.width)))
+
+    @property
+    def occupied(self) -> int:
+        return len(self.cells)
+
+    def indices_of(self, char: str) -> list[int]:
+        code = self.code(char)
+        if code == self.cells.background:
+            return [i for i in range(len(self)) if i not in self.cells]
+        return sorted(i for i, c in self.cells.items() if c == code)
+
+    def find(self, char: str) -> Point | None:
+        indices = self.indices_of(char)
+        return self.point(indices[0]) if indices else None
+
+    def count(self, char: str) -> int:
+        code = self.code(char)
+        if code == self.cells.background:
+            return len(self) - len(self.cells)
+        return sum(1 for c in self.cells.values() if c == code)
+
+    def copy(self) -> 'SparseGrid':
+        new = SparseGrid(self.width, self.height, self.fill, self.legend)
+        new.cells.update(self.cells)
+        return new
+
+    def to_dense(self) -> Grid:
+        dense = Grid(self.width, self.height, self.fill, self.legend)
+        for i, code in self.cells.items():
+            dense.cells[i] = code
+        return dense
+
+    def to_numpy(self):
+        """Dense (height, width) uint8 copy of the cells."""
+        return self.to_dense().to_numpy()
+
+    def __str__(self):
+        return str(self.to_dense())
+
+
+def make_grid(width: int, height: int,
+              cells: 'dict[Point | tuple[int, int], str]' = None,
+              fill: str | None = '.', legend: dict[str, int] = None,
+              threshold: float = SPARSE_THRESHOLD) -> Grid | SparseGrid:
+    """Build a sparse or dense grid holding ``cells``, by their occupancy.
+
+    Without a ``fill`` no cell is empty, so the grid is always dense.
+    """
+    cells = cells or {}
+    area = width * height
+    if fill is not None and area and len(cells) / area < threshold:
+        grid = SparseGrid(width, height, fill, legend)
+    else:
+        grid = Grid(width, height, fill, legend)
+    for key, char in cells.items():
+        grid[key] = char
+    return grid
+
+
+class AdaptiveGrid:
+    """A grid that switches backend as it fills up or empties.
+
+    It starts as whichever backend ``make_grid`` picks. It turns dense once
+    more than ``threshold`` of the cells are occupied, and sparse again
+    below half of that; the gap keeps a grid hovering near the threshold
+    from converting back and forth. Everything except assignment is
+    forwarded to the current ``backend``.
+    """
+    __slots__ = ('backend', 'threshold', 'occupied')
+
+    def __init__(self, width: int, height: int,
+                 cells: 'dict[Point | tuple[int, int], str]' = None,
+                 fill: str | None = '.', legend: dict[str, int] = None,
+                 threshold: float = SPARSE_THRESHOLD):
+        self.backend = make_grid(width, height, cells, fill, legend,
+                                 threshold)
+        self.threshold = threshold
+        self.occupied = self.backend.occupied
+
+    @property
+    def is_sparse(self) -> bool:
+        return isinstance(self.backend, SparseGrid)
+
+    def __getattr__(self, name: str):
+        if name == 'backend':
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+
+    def __len__(self):
+        return len(self.backend)
+
+    def __contains__(self, key: GridKey) -> bool:
+        return key in self.backend
+
+    def __getitem__(self, key: GridKey) -> str:
+        return self.backend[key]
+
+    def __setitem__(self, key: GridKey, char: str):
+        backend = self.backend
+        was_empty = backend[key] == backend.fill
+        backend[key] = char
+        is_empty = char == backend.fill
+        if was_empty and not is_empty:
+            self.occupied += 1
+            if self.is_sparse and self.occupied > self.threshold * len(self):
+                self.backend = backend.to_dense()
+        elif is_empty and not was_empty:
+            self.occupied -= 1
+            if not self.is_sparse \
+                    and self.occupied < self.threshold * len(self) / 2:
+                self.backend = backend.to_sparse()
+
+    def __str__(self):
+        return str(self.backend)
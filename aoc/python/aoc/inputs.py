@@ -0,0 +1,79 @@
+import contextlib
+import mmap
+import os
+from enum import Enum
+
+from .grid import Grid
+
+
+class InputType(Enum):
+    INPUT = 0,
+    EXAMPLE = 1,
+    EXAMPLE2 = 2,
+    EXAMPLE3 = 3,
+    EXAMPLE4 = 4,
+    GENERATED = 5,
+
+
+def get_filepath(input_type: InputType) -> str:
+    match input_type:
+        case InputType.INPUT:
+            filepath = './input.txt'
+        case InputType.EXAMPLE:
+            filepath = './example.txt'
+        case InputType.EXAMPLE2:
+            filepath = './example2.txt'
+        case InputType.EXAMPLE3:
+            filepath = './example3.txt'
+        case InputType.EXAMPLE4:
+            filepath = './example4.txt'
+        case InputType.GENERATED:
+            filepath = './generated.txt'
+        case _:
+            raise ValueError
+    return filepath
+
+
+def parse_file(input_type: InputType, as_grid: bool = False,
+               legend: dict[str, int] = None, fill: str | None = '.'):
+    with open(get_filepath(input_type)) as f:
+        data = [s.strip('\n') for s in f.readlines()]
+
+    if as_grid:
+        return Grid.from_rows(data, legend=legend, fill=fill)
+    return data
+
+
+def iter_lines(input_type: InputType):
+    """Yield the lines of the input one at a time, without the newline."""
+    with open(get_filepath(input_type)) as f:
+        for line in f:
+            yield line.rstrip('\n')
+
+
+def iter_records(input_type: InputType):
+    """Yield each blank-line separated block of the input as a list of rows."""
+    record = []
+    for line in iter_lines(input_type):
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
+
+@contextlib.contextmanager
+def map_file(input_type: InputType):
+    """Read-only ``mmap`` of the raw input bytes, for byte-level parsers.
+
+    Slicing, ``find`` and ``readline`` work on it without loading the file
+    into memory; empty files give an empty ``bytes`` object instead.
+    """
+    with open(get_filepath(input_type), 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
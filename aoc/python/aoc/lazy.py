@@ -0,0 +1,31 @@
+import importlib
+import sys
+
+
+class LazyModule:
+    """Stand-in for a module that is only imported on first attribute access.
+
+    Lets heavy optional dependencies (numpy, networkx, pyvis, ...) be named
+    at the top of a module without paying for, or requiring, the import
+    until a code path actually uses them.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f'<lazy module {self._name!r} ({state})>'
+
+
+def lazy_import(name: str):
+    """Return module ``name``, deferring the import until it is first used."""
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
@@ -0,0 +1,202 @@
+import dataclasses
+import sys
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from enum import Enum
+from functools import wraps
+from typing import Callable, Hashable
+
+_MISSING = object()
+
+
+class Eviction(Enum):
+    LRU = 1
+    LFU = 2
+
+
+class HashedTuple(tuple):
+    """A tuple that computes its hash once.
+
+    Equal to, and hashing like, the plain tuple with the same items, so it
+    can stand in for a large constant argument that would otherwise be
+    re-hashed on every memoized call.
+    """
+
+    def __init__(self, *args):
+        self._hash = tuple.__hash__(self)
+
+    def __hash__(self):
+        return self._hash
+
+
+@dataclass
+class MemoStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.
+
+    def __str__(self):
+        return (f'{self.hits} hits, {self.misses} misses '
+                f'({self.hit_rate:.1%} hit rate), {self.evictions} '
+                f'evictions, {self.entries} entries, {self.bytes} bytes')
+
+
+class MemoCache:
+    """Key -> value store with an entry and/or byte budget.
+
+    When adding an entry would exceed ``maxsize`` entries or ``maxbytes``
+    bytes, entries are evicted first: the least recently used with
+    ``Eviction.LRU``, or the least frequently used (oldest first among
+    ties) with ``Eviction.LFU``. Bytes are the shallow ``sys.getsizeof``
+    of each key and value, so they are only counted when ``maxbytes`` is
+    set, and anything the values share is not counted at all.
+    """
+
+    def __init__(self, maxsize: int = None, maxbytes: int = None,
+                 eviction: Eviction = Eviction.LRU):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.eviction = eviction
+        self.stats = MemoStats()
+        self._values = {}
+        self._order = OrderedDict()
+        self._counts = {}
+        self._buckets = defaultdict(OrderedDict)
+        self._min_count = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._values
+
+    def get(self, key: Hashable, default=None):
+        entry = self._values.get(key, _MISSING)
+        if entry is _MISSING:
+            self.stats.misses += 1
+            return default
+        self.stats.hits += 1
+        self._touch(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value):
+        if key in self._values:
+            self._remove(key)
+        size = 0
+        if self.maxbytes is not None:
+            size = sys.getsizeof(key) + sys.getsizeof(value)
+            if size > self.maxbytes:
+                return
+        while self._values and (
+                (self.maxsize is not None
+                 and len(self._values) >= self.maxsize)
+                or (self.maxbytes is not None
+                    and self.stats.bytes + size > self.maxbytes)):
+            self._evict()
+        if self.maxsize == 0:
+            return
+        self._values[key] = (value, size)
+        self.stats.entries += 1
+        self.stats.bytes += size
+        if self.eviction == Eviction.LRU:
+            self._order[key] = None
+        else:
+            self._counts[key] = 1
+            self._buckets[1][key] = None
+            self._min_count = 1
+
+    def clear(self):
+        self._values.clear()
+        self._order.clear()
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
+        self.stats = MemoStats()
+
+    def _touch(self, key: Hashable):
+        if self.eviction == Eviction.LRU:
+            self._order.move_to_end(key)
+            return
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets[count + 1][key] = None
+
+    def _evict(self):
+        if self.eviction == Eviction.LRU:
+            key, _ = self._order.popitem(last=False)
+        else:
+            bucket = self._buckets[self._min_count]
+            key, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_count]
+                self._min_count = min(self._buckets, default=0)
+            del self._counts[key]
+        _, size = self._values.pop(key)
+        self.stats.entries -= 1
+        self.stats.bytes -= size
+        self.stats.evictions += 1
+
+    def _remove(self, key: Hashable):
+        _, size = self._values.pop(key)
+        self.stats.entries -= 1
+        self.stats.bytes -= size
+        if self.eviction == Eviction.LRU:
+            del self._order[key]
+        else:
+            count = self._counts.pop(key)
+            del self._buckets[count][key]
+            if not self._buckets[count]:
+                del self._buckets[count]
+                self._min_count = min(self._buckets, default=0)
+
+
+def memoize(function: Callable = None, *, maxsize: int = None,
+            maxbytes: int = None, eviction: Eviction = Eviction.LRU,
+            key: Callable[..., Hashable] = None):
+    """Memoize a function in a ``MemoCache`` with the given budget.
+
+    ``key(*args, **kw)`` replaces the default key of the arguments, e.g.
+    to drop an argument that never changes or to normalise one. Use
+    ``HashedTuple`` for a large tuple argument that is hashed on every
+    call. The wrapper has ``cache_info()`` (a copy of the ``MemoStats``),
+    ``cache_clear()`` and the ``cache`` itself. Works bare, as
+    ``@memoize``, or configured, as ``@memoize(maxsize=...)``.
+    """
+    def decorate(f):
+        cache = MemoCache(maxsize, maxbytes, eviction)
+
+        @wraps(f)
+        def wrap(*args, **kw):
+            if key is not None:
+                k = key(*args, **kw)
+            elif kw:
+                k = (args, frozenset(kw.items()))
+            else:
+                k = args
+            value = cache.get(k, _MISSING)
+            if value is _MISSING:
+                value = f(*args, **kw)
+                cache.put(k, value)
+            return value
+
+        wrap.cache = cache
+        wrap.cache_info = lambda: dataclasses.replace(cache.stats)
+        wrap.cache_clear = cache.clear
+        return wrap
+
+    if function is not None:
+        return decorate(function)
+    return decorate
@@ -0,0 +1,189 @@
+import contextlib
+import importlib.util
+import inspect
+import io
+import json
+import os
+import pathlib
+import re
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from time import perf_counter_ns
+
+from .inputs import InputType
+from .timing import TimeUnit, format_duration
+
+DAY_PATTERN = re.compile(r'day(\d+)$')
+ANSWER_PATTERN = re.compile(r'^Part\s*\d+\s*:?\s*(.*)$')
+
+
+@dataclass(frozen=True)
+class DayModule:
+    day: int
+    path: pathlib.Path
+
+    @property
+    def directory(self) -> pathlib.Path:
+        """The ``dayNN`` directory, also for days with a ``src/main.py``."""
+        parent = self.path.parent
+        return parent if DAY_PATTERN.match(parent.name) else parent.parent
+
+
+@dataclass
+class PartResult:
+    day: int
+    part: int
+    input: str
+    answer: str | None = None
+    seconds: float = 0.
+    output: str = ''
+    error: str | None = None
+    skipped: bool = False
+
+    @property
+    def status(self) -> str:
+        if self.skipped:
+            return 'skipped'
+        return 'error' if self.error is not None else 'ok'
+
+
+def discover_days(root: str | pathlib.Path = '.') -> list[DayModule]:
+    """Find each ``dayNN`` directory's ``main.py`` (or ``src/main.py``)."""
+    days = []
+    for directory in sorted(pathlib.Path(root).iterdir()):
+        match = DAY_PATTERN.match(directory.name)
+        if not directory.is_dir() or match is None:
+            continue
+        for path in (directory / 'main.py', directory / 'src' / 'main.py'):
+            if path.is_file():
+                days.append(DayModule(int(match.group(1)), path.resolve()))
+                break
+    return days
+
+
+def load_day(day: DayModule):
+    """Import a day's main.py under a unique name, from its own directory."""
+    os.chdir(day.path.parent)
+    if str(day.path.parent) not in sys.path:
+        sys.path.insert(0, str(day.path.parent))
+    name = f'day{day.day:02d}_main'
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, day.path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def find_answer(output: str) -> str | None:
+    answer = None
+    for line in output.splitlines():
+        match = ANSWER_PATTERN.match(line.strip())
+        if match is not None:
+            answer = match.group(1).strip()
+    return answer
+
+
+class SkipPart(Exception):
+    """Raised when a part cannot be run on the requested input."""
+
+
+def reads_input_file(module, part: int) -> bool:
+    """Whether ``part<n>`` takes no input type and opens ``input.txt``."""
+    function = getattr(module, f'part{part}', None)
+    return function is not None and not inspect.signature(function).parameters
+
+
+def resolve_part(module, part: int, input_name: str):
+    """The ``part<n>`` function of ``module`` and the arguments to call it.
+
+    Parts that take an input type are given the member called
+    ``input_name`` of the day's own ``InputType`` (or ``aoc.InputType``).
+    Parts that take no arguments always read their real input, so they are
+    only run when ``input_name`` is ``INPUT``.
+    """
+    function = getattr(module, f'part{part}', None)
+    if function is None:
+        raise SkipPart(f'no part{part} function')
+    args = []
+    if inspect.signature(function).parameters:
+        input_types = getattr(module, 'InputType', InputType)
+        if input_name not in input_types.__members__:
+            raise SkipPart(f'no {input_name} input type')
+        args.append(input_types[input_name])
+    elif input_name != InputType.INPUT.name:
+        raise SkipPart('part only reads its real input')
+    return function, args
+
+
+def run_part(day: DayModule, part: int, input_name: str) -> PartResult:
+    """Run one part of one day and capture its answer, output and time."""
+    result = PartResult(day.day, part, input_name)
+    stdout = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(stdout):
+            module = load_day(day)
+        function, args = resolve_part(module, part, input_name)
+        with contextlib.redirect_stdout(stdout):
+            ts = perf_counter_ns()
+            function(*args)
+            te = perf_counter_ns()
+        result.seconds = (te - ts) / 1e9
+    except SkipPart as e:
+        result.skipped = True
+        result.error = str(e)
+        return result
+    except Exception:
+        result.error = traceback.format_exc(limit=-1).strip().splitlines()[-1]
+    result.output = stdout.getvalue()
+    result.answer = find_answer(result.output)
+    return result
+
+
+def run(days: list[DayModule], parts: list[int], input_names: list[str],
+        jobs: int = None) -> list[PartResult]:
+    """Run every (day, part, input) combination across a process pool."""
+    tasks = [(day, part, input_name) for day in days for part in parts
+             for input_name in input_names]
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(run_part, *task) for task in tasks]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return sorted(results, key=lambda r: (r.day, r.part, r.input))
+
+
+def format_report(results: list[PartResult], wall_seconds: float,
+                  unit: TimeUnit = TimeUnit.ms) -> str:
+    rows = [('day', 'part', 'input', 'status', 'time', 'answer')]
+    for r in results:
+        time_string = format_duration(r.seconds, unit) if r.status == 'ok' \
+            else ''
+        detail = r.answer if r.error is None else r.error
+        rows.append((f'{r.day:02d}', str(r.part), r.input.lower(), r.status,
+                     time_string, detail or ''))
+    widths = [max(len(row[i]) for row in rows) for i in range(5)]
+    lines = ['  '.join(cell.ljust(width) for cell, width in zip(row, widths))
+             + '  ' + row[-1] for row in rows]
+    total = sum(r.seconds for r in results)
+    lines.append('')
+    lines.append(f'{len(results)} parts, '
+                 f'{sum(r.status == "error" for r in results)} errors: '
+                 f'{format_duration(total, TimeUnit.s)} of work in '
+                 f'{format_duration(wall_seconds, TimeUnit.s)} wall time')
+    return '\n'.join(lines)
+
+
+def write_report(results: list[PartResult], wall_seconds: float,
+                 path: str | pathlib.Path):
+    data = {'wall_seconds': wall_seconds,
+            'results': [asdict(r) | {'status': r.status} for r in results]}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
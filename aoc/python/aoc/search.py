@@ -0,0 +1,187 @@
+import heapq
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Hashable, Iterable
+
+from .grid import Grid
+
+Node = Hashable
+Neighbors = Callable[[Node], Iterable[Node]]
+WeightedNeighbors = Callable[[Node], Iterable[tuple[Node, int]]]
+
+
+@dataclass
+class SearchResult:
+    """Distances and predecessors found by a search from ``start``.
+
+    ``predecessors`` maps each reached node to the node it was reached
+    from, or to the set of all equally short predecessors when the search
+    was run with ``all_predecessors=True``. ``goal`` is the first goal
+    node settled, if any.
+    """
+    start: Node
+    distances: dict[Node, int] = field(default_factory=dict)
+    predecessors: dict[Node, Node | set[Node]] = field(default_factory=dict)
+    goal: Node = None
+
+    @property
+    def found(self) -> bool:
+        return self.goal is not None
+
+    def path(self, node: Node = None) -> list[Node]:
+        """One shortest path from ``start`` to ``node`` (default: goal)."""
+        if node is None:
+            node = self.goal
+        if node not in self.distances:
+            raise KeyError(f'{node!r} was not reached')
+        path = [node]
+        while node != self.start:
+            node = self.predecessors[node]
+            if isinstance(node, set):
+                node = next(iter(node))
+            path.append(node)
+        return path[::-1]
+
+    def nodes_on_shortest_paths(self, *ends: Node) -> set[Node]:
+        """Every node on any shortest path to ``ends`` (default: goal)."""
+        stack = list(ends) if ends else [self.goal]
+        seen = set(stack)
+        while stack:
+            node = stack.pop()
+            previous = self.predecessors.get(node, ())
+            if not isinstance(previous, set):
+                previous = (previous,)
+            for p in previous:
+                if p not in seen:
+                    seen.add(p)
+                    stack.append(p)
+        return seen
+
+
+def bfs(start: Node, neighbors: Neighbors,
+        is_goal: Callable[[Node], bool] = None) -> SearchResult:
+    """Breadth-first search with a deque; stops at the first goal."""
+    result = SearchResult(start, {start: 0})
+    distances, predecessors = result.distances, result.predecessors
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        if is_goal is not None and is_goal(node):
+            result.goal = node
+            break
+        distance = distances[node] + 1
+        for neighbor in neighbors(node):
+            if neighbor not in distances:
+                distances[neighbor] = distance
+                predecessors[neighbor] = node
+                queue.append(neighbor)
+    return result
+
+
+def bfs01(start: Node, neighbors: WeightedNeighbors,
+          is_goal: Callable[[Node], bool] = None) -> SearchResult:
+    """Shortest paths when every edge costs 0 or 1, using a deque."""
+    result = SearchResult(start, {start: 0})
+    distances, predecessors = result.distances, result.predecessors
+    queue = deque([start])
+    settled = set()
+    while queue:
+        node = queue.popleft()
+        if node in settled:
+            continue
+        settled.add(node)
+        if is_goal is not None and is_goal(node):
+            result.goal = node
+            break
+        for neighbor, cost in neighbors(node):
+            distance = distances[node] + cost
+            if distance < distances.get(neighbor, distance + 1):
+                distances[neighbor] = distance
+                predecessors[neighbor] = node
+                if cost == 0:
+                    queue.appendleft(neighbor)
+                else:
+                    queue.append(neighbor)
+    return result
+
+
+def dijkstra(start: Node, neighbors: WeightedNeighbors,
+             is_goal: Callable[[Node], bool] = None,
+             all_predecessors: bool = False) -> SearchResult:
+    """Heap-based Dijkstra; see ``astar`` for the arguments."""
+    return astar(start, neighbors, None, is_goal, all_predecessors)
+
+
+def astar(start: Node, neighbors: WeightedNeighbors,
+          heuristic: Callable[[Node], int] = None,
+          is_goal: Callable[[Node], bool] = None,
+          all_predecessors: bool = False) -> SearchResult:
+    """A* search (Dijkstra when ``heuristic`` is None).
+
+    ``neighbors(node)`` yields ``(neighbor, cost)`` pairs with
+    non-negative costs. Settled nodes are never reopened, so ``heuristic``
+    must be consistent, ``h(u) <= cost(u, v) + h(v)`` for every edge, and
+    not merely admissible; with an inconsistent one, distances and paths
+    may not be the shortest. The search stops once a goal is settled; with
+    ``all_predecessors`` it carries on until every node as close as that
+    goal is settled, so that ``predecessors`` holds all the shortest paths
+    to every goal at the best distance.
+    """
+    result = SearchResult(start, {start: 0})
+    distances, predecessors = result.distances, result.predecessors
+    counter = itertools.count()
+    estimate = 0 if heuristic is None else heuristic(start)
+    heap = [(estimate, 0, next(counter), start)]
+    settled = set()
+    goal_distance = None
+    while heap:
+        _, distance, _, node = heapq.heappop(heap)
+        if node in settled:
+            continue
+        if goal_distance is not None and distance > goal_distance:
+            break
+        settled.add(node)
+        if is_goal is not None and is_goal(node):
+            if result.goal is None:
+                result.goal = node
+                goal_distance = distance
+            if not all_predecessors:
+                break
+            continue
+        for neighbor, cost in neighbors(node):
+            new_distance = distance + cost
+            old_distance = distances.get(neighbor)
+            if old_distance is None or new_distance < old_distance:
+                distances[neighbor] = new_distance
+                predecessors[neighbor] = {node} if all_predecessors else node
+                estimate = new_distance
+                if heuristic is not None:
+                    estimate += heuristic(neighbor)
+                heapq.heappush(heap, (estimate, new_distance, next(counter),
+                                      neighbor))
+            elif all_predecessors and new_distance == old_distance:
+                predecessors[neighbor].add(node)
+    return result
+
+
+def grid_neighbors(grid: Grid, passable: str) -> Callable[[int], list[int]]:
+    """Neighbour function over flat ``grid`` indices for ``bfs`` and co.
+
+    Only cells whose character is in ``passable`` are yielded, so searches
+    run on the grid's packed ints without building any ``Point``.
+    """
+    allowed = bytes(grid.code(c) for c in passable)
+    lookup = [False] * 256
+    for code in allowed:
+        lookup[code] = True
+    cells = grid.cells
+    neighbor_indices = grid.neighbor_indices
+
+    def neighbors(index: int) -> list[int]:
+        return [n for n in neighbor_indices(index) if lookup[cells[n]]]
+    return neighbors
+
+
+def manhattan_distance(a, b) -> int:
+    return abs(a.x - b.x) + abs(a.y - b.y)
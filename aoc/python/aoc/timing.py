@@ -0,0 +1,304 @@
+import contextlib
+import gc
+import inspect
+import json
+import math
+import os
+import pathlib
+import sys
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from enum import Enum
+from functools import wraps
+from time import perf_counter_ns
+
+
+class TimeUnit(Enum):
+    s = 1
+    ms = 2
+    us = 3
+    min = 4
+    hr = 5
+
+
+def format_duration(seconds: float, unit: TimeUnit) -> str:
+    match unit:
+        case TimeUnit.s:
+            return f'{seconds:.4f} s'
+        case TimeUnit.ms:
+            return f'{1000*seconds:.4f} ms'
+        case TimeUnit.us:
+            return f'{1000000*seconds:.4f} us'
+        case TimeUnit.min:
+            return f'{seconds/60.:.4f} min'
+        case TimeUnit.hr:
+            return f'{seconds/3600.:.4f} hr'
+        case _:
+            raise ValueError
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    timings_ns: list[int]
+    warmup: int = 0
+    gc_disabled: bool = False
+
+    @property
+    def repeat(self) -> int:
+        return len(self.timings_ns)
+
+    @property
+    def min_ns(self) -> int:
+        return min(self.timings_ns)
+
+    @property
+    def median_ns(self) -> float:
+        ordered = sorted(self.timings_ns)
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            return ordered[middle]
+        return (ordered[middle - 1] + ordered[middle]) / 2
+
+    @property
+    def p95_ns(self) -> int:
+        ordered = sorted(self.timings_ns)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    @property
+    def mean_ns(self) -> float:
+        return sum(self.timings_ns) / len(self.timings_ns)
+
+    def summary(self, unit: TimeUnit = TimeUnit.s) -> str:
+        if self.repeat == 1:
+            return format_duration(self.timings_ns[0] / 1e9, unit)
+        return (f'min {format_duration(self.min_ns / 1e9, unit)}, '
+                f'median {format_duration(self.median_ns / 1e9, unit)}, '
+                f'p95 {format_duration(self.p95_ns / 1e9, unit)} '
+                f'over {self.repeat} runs')
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data.update(min_ns=self.min_ns, median_ns=self.median_ns,
+                    p95_ns=self.p95_ns, mean_ns=self.mean_ns)
+        return data
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+
+def benchmark(f, *args, repeat: int = 5, warmup: int = 1,
+              disable_gc: bool = False, **kw):
+    """Time ``f(*args, **kw)`` over ``repeat`` runs after ``warmup`` runs.
+
+    Returns the result of the last run and a ``BenchmarkResult``.
+    """
+    if repeat < 1:
+        raise ValueError('repeat must be at least 1')
+    result = None
+    for _ in range(warmup):
+        result = f(*args, **kw)
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        for _ in range(repeat):
+            ts = perf_counter_ns()
+            result = f(*args, **kw)
+            te = perf_counter_ns()
+            timings.append(te - ts)
+    finally:
+        if disable_gc and gc_was_enabled:
+            gc.enable()
+    return result, BenchmarkResult(f.__name__, timings, warmup, disable_gc)
+
+
+class Profiler(ABC):
+    """A profiling hook that ``timer`` can switch on around a call.
+
+    Subclasses start collecting in ``start`` and write their report to
+    ``path`` (with ``suffix`` appended) in ``stop``.
+    """
+    suffix = '.txt'
+
+    @abstractmethod
+    def start(self):
+        ...
+
+    @abstractmethod
+    def stop(self, path: pathlib.Path):
+        ...
+
+
+class CProfileProfiler(Profiler):
+    suffix = '.prof'
+
+    def start(self):
+        import cProfile
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def stop(self, path: pathlib.Path):
+        self.profile.disable()
+        self.profile.dump_stats(path)
+
+
+class TracemallocProfiler(Profiler):
+    def __init__(self, frames: int = 10, top: int = 25):
+        self.frames = frames
+        self.top = top
+
+    def start(self):
+        import tracemalloc
+        tracemalloc.start(self.frames)
+
+    def stop(self, path: pathlib.Path):
+        import tracemalloc
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stats = snapshot.statistics('lineno')
+        lines = [f'peak: {peak} B', f'current: {current} B',
+                 f'allocations: {sum(stat.count for stat in stats)}', '']
+        lines.extend(str(stat) for stat in stats[:self.top])
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+
+class SamplingProfiler(Profiler):
+    """Samples the calling thread's stack from a background thread.
+
+    The report is in collapsed-stack format (``outer;inner count`` per
+    line), which flame graph tools read directly.
+    """
+    suffix = '.folded'
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+
+    def start(self):
+        self.samples = {}
+        self.thread_id = threading.get_ident()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+        self.thread.start()
+
+    def sample(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} '
+                             f'({pathlib.Path(code.co_filename).name}'
+                             f':{code.co_firstlineno})')
+                frame = frame.f_back
+            key = ';'.join(reversed(stack))
+            self.samples[key] = self.samples.get(key, 0) + 1
+
+    def stop(self, path: pathlib.Path):
+        self.stopped.set()
+        self.thread.join()
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.samples.items(),
+                                       key=lambda item: -item[1]):
+                f.write(f'{stack} {count}\n')
+
+
+PROFILERS: dict[str, type[Profiler]] = {
+    'cprofile': CProfileProfiler,
+    'tracemalloc': TracemallocProfiler,
+    'sample': SamplingProfiler,
+}
+
+
+def register_profiler(name: str, profiler: type[Profiler]):
+    PROFILERS[name] = profiler
+
+
+@contextlib.contextmanager
+def profiled(name: str, profile: str | list[str] = None,
+             directory: str | pathlib.Path = None):
+    """Run the enclosed block under the named profilers.
+
+    ``profile`` is a profiler name, a comma-separated string or a list of
+    names from ``PROFILERS``; it defaults to the ``AOC_PROFILE``
+    environment variable. Reports go to ``directory`` (default
+    ``AOC_PROFILE_DIR`` or ``./profiles``) as ``<name>.<profiler><suffix>``,
+    written to a temporary file first so that processes profiling the
+    same name at once never interleave.
+    """
+    if profile is None:
+        profile = os.environ.get('AOC_PROFILE', '')
+    if isinstance(profile, str):
+        profile = [p.strip() for p in profile.split(',') if p.strip()]
+    if not profile:
+        yield
+        return
+    unknown = [p for p in profile if p not in PROFILERS]
+    if unknown:
+        raise ValueError(f'unknown profiler {", ".join(unknown)}; '
+                         f'expected one of {", ".join(PROFILERS)}')
+    if directory is None:
+        directory = os.environ.get('AOC_PROFILE_DIR', './profiles')
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    profilers = [(p, PROFILERS[p]()) for p in profile]
+    for _, profiler in profilers:
+        profiler.start()
+    try:
+        yield
+    finally:
+        for p, profiler in reversed(profilers):
+            path = directory / f'{name}.{p}{profiler.suffix}'
+            temporary = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+            profiler.stop(temporary)
+            os.replace(temporary, path)
+
+
+def _profile_name(f) -> str:
+    """``dayNN.<qualname>``: the directory holding ``f``'s source file.
+
+    The module name is ``__main__`` when a day runs directly, so the
+    directory is what tells the days' ``part1`` functions apart.
+    """
+    directory = pathlib.Path(inspect.getfile(f)).resolve().parent
+    if directory.name == 'src':
+        directory = directory.parent
+    return f'{directory.name}.{f.__qualname__}'
+
+
+# Based on https://stackoverflow.com/questions/1622943/timeit-versus-timing-decorator
+def timer(unit: TimeUnit = TimeUnit.s, repeat: int = 1, warmup: int = 0,
+          disable_gc: bool = False, json_path: str | pathlib.Path = None,
+          profile: str | list[str] = None,
+          profile_dir: str | pathlib.Path = None):
+    """Print how long each call takes.
+
+    With ``repeat``/``warmup`` the call is benchmarked and min, median and
+    p95 are printed instead. If ``json_path`` is given each measurement is
+    also appended to it as a line of JSON. ``profile``/``profile_dir`` (or
+    the ``AOC_PROFILE``/``AOC_PROFILE_DIR`` environment variables) run the
+    call under the profilers described in ``profiled``, named after the
+    day directory and the function, e.g. ``day17.part1``.
+    """
+    def timing(f):
+        name = _profile_name(f)
+
+        @wraps(f)
+        def wrap(*args, **kw):
+            with profiled(name, profile, profile_dir):
+                result, bench = benchmark(f, *args, repeat=repeat,
+                                          warmup=warmup,
+                                          disable_gc=disable_gc, **kw)
+            print(f'func:{f.__name__} args:{args}{kw} took: '
+                  f'{bench.summary(unit)}')
+            if json_path is not None:
+                with open(json_path, 'a', encoding='utf-8') as file:
+                    file.write(bench.to_json() + '\n')
+            return result
+        return wrap
+    return timing
@@ -0,0 +1,17 @@
+def chunk_list(lst, n):
+    """Yield successive n-sized chunks from lst."""
+    for i in range(0, len(lst), n):
+        yield lst[i:i + n]
+
+
+def chunk_pairs(lst):
+    """Yield successive n-sized chunks from lst."""
+    for i in range(0, len(lst)-1, 1):
+        yield lst[i:i + 2]
+
+
+def get_last_index(a: list | tuple) -> int:
+  for i, e in enumerate(reversed(a)):
+    if e is not None:
+      return len(a) - i - 1
+  return -1
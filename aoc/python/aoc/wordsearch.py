@@ -0,0 +1,195 @@
+from dataclasses import dataclass
+from typing import Iterable
+
+from .geometry import Direction8, Point
+from .lazy import lazy_import
+
+np = lazy_import('numpy')
+
+
+@dataclass(frozen=True)
+class Template:
+    """A 2D pattern to find in a grid; ``wildcard`` cells match anything."""
+    rows: tuple[str, ...]
+    wildcard: str = '.'
+
+    def __post_init__(self):
+        object.__setattr__(self, 'rows', tuple(self.rows))
+        if not self.rows:
+            raise ValueError('a template needs at least one row')
+        for j, row in enumerate(self.rows):
+            if len(row) != self.width:
+                raise ValueError(f'Row {j} has length {len(row)}, '
+                                 f'expected {self.width}')
+
+    @property
+    def width(self) -> int:
+        return len(self.rows[0])
+
+    @property
+    def height(self) -> int:
+        return len(self.rows)
+
+    def cells(self) -> list[tuple[int, int, str]]:
+        """(x, y, char) of every cell that is not a wildcard."""
+        return [(x, y, char) for y, row in enumerate(self.rows)
+                for x, char in enumerate(row) if char != self.wildcard]
+
+    def rotate_clockwise(self) -> 'Template':
+        rows = tuple(''.join(row[x] for row in reversed(self.rows))
+                     for x in range(self.width))
+        return Template(rows, self.wildcard)
+
+    def reflect(self) -> 'Template':
+        """Mirror image, flipped left to right."""
+        return Template(tuple(row[::-1] for row in self.rows), self.wildcard)
+
+    def variants(self, rotations: bool = True, reflections: bool = True
+                 ) -> list['Template']:
+        """The distinct templates reachable by rotating and/or reflecting."""
+        starts = [self, self.reflect()] if reflections else [self]
+        result = []
+        for template in starts:
+            for _ in range(4 if rotations else 1):
+                if template not in result:
+                    result.append(template)
+                template = template.rotate_clockwise()
+        return result
+
+
+class BitBoards:
+    """A character grid as one bitboard (a Python int) per character.
+
+    Bit ``y * stride + x`` of ``board(c)`` is set where row ``y`` holds
+    ``c`` at column ``x``. ``stride`` is ``width + 1``: every row is
+    followed by a clear bit, so a step off either side of a row lands on
+    that bit instead of wrapping onto the next row. Shifting a board and
+    ANDing it with another tests every cell of the grid at once. Boards
+    are built with NumPy the first time a character is looked up.
+    """
+
+    def __init__(self, rows: list[str]):
+        while rows and not rows[-1]:
+            rows = rows[:-1]
+        self.width = len(rows[0]) if rows else 0
+        self.height = len(rows)
+        self.stride = self.width + 1
+        for j, row in enumerate(rows):
+            if len(row) != self.width:
+                raise ValueError(f'Row {j} has length {len(row)}, '
+                                 f'expected {self.width}')
+        text = ''.join(row + '\n' for row in rows)
+        try:
+            self._codes = np.frombuffer(text.encode('latin-1'),
+                                        dtype=np.uint8)
+        except UnicodeEncodeError:
+            self._codes = np.frombuffer(text.encode('utf-32-le'),
+                                        dtype=np.uint32)
+        self._boards = {}
+        self._anchors = {}
+
+    @classmethod
+    def from_file(cls, path: str) -> 'BitBoards':
+        with open(path) as f:
+            return cls(f.read().split('\n'))
+
+    @property
+    def alphabet(self) -> set[str]:
+        return {chr(c) for c in np.unique(self._codes)} - {'\n'}
+
+    def board(self, char: str) -> int:
+        board = self._boards.get(char)
+        if board is None:
+            code = ord(char)
+            if char == '\n' or code > np.iinfo(self._codes.dtype).max:
+                board = 0
+            else:
+                bits = np.packbits(self._codes == code, bitorder='little')
+                board = int.from_bytes(bits.tobytes(), 'little')
+            self._boards[char] = board
+        return board
+
+    def step(self, direction: Direction8) -> int:
+        """Bit offset of one step in ``direction``."""
+        return direction.dy * self.stride + direction.dx
+
+    def starts(self, word: str, direction: Direction8) -> int:
+        """Board of the cells where ``word`` starts, read in ``direction``."""
+        if not word:
+            raise ValueError('cannot search for an empty word')
+        step = self.step(direction)
+        matches = self.board(word[0])
+        for k, char in enumerate(word[1:], 1):
+            if not matches:
+                break
+            offset = k * step
+            board = self.board(char)
+            matches &= board >> offset if offset >= 0 else board << -offset
+        return matches
+
+    def count(self, word: str,
+              directions: Iterable[Direction8] = Direction8) -> int:
+        """Occurrences of ``word``, one per start cell and direction.
+
+        A palindrome is counted once in each of its two directions.
+        """
+        return sum(self.starts(word, d).bit_count() for d in directions)
+
+    def count_words(self, words: Iterable[str],
+                    directions: Iterable[Direction8] = Direction8
+                    ) -> dict[str, int]:
+        directions = tuple(directions)
+        return {word: self.count(word, directions) for word in words}
+
+    def find(self, word: str, directions: Iterable[Direction8] = Direction8
+             ) -> list[tuple[Point, Direction8]]:
+        """Start cell and direction of every occurrence of ``word``."""
+        return [(p, d) for d in directions
+                for p in self.points(self.starts(word, d))]
+
+    def anchors(self, width: int, height: int) -> int:
+        """Board of the cells where a box of this size fits, top-left."""
+        key = (width, height)
+        board = self._anchors.get(key)
+        if board is None:
+            mask = np.zeros((self.height, self.stride), dtype=bool)
+            mask[:self.height - height + 1, :self.width - width + 1] = True
+            bits = np.packbits(mask, bitorder='little')
+            board = self._anchors[key] = int.from_bytes(bits.tobytes(),
+                                                        'little')
+        return board
+
+    def match(self, template: Template) -> int:
+        """Board of the top-left cells where ``template`` matches as is."""
+        if template.width > self.width or template.height > self.height:
+            return 0
+        matches = self.anchors(template.width, template.height)
+        for x, y, char in template.cells():
+            if not matches:
+                break
+            matches &= self.board(char) >> (y * self.stride + x)
+        return matches
+
+    def count_template(self, template: Template, rotations: bool = True,
+                       reflections: bool = True) -> int:
+        """Matches of every distinct variant of ``template``, summed.
+
+        Variants that coincide, such as the rotations of a symmetric
+        template, are only counted once.
+        """
+        return sum(self.match(t).bit_count()
+                   for t in template.variants(rotations, reflections))
+
+    def find_template(self, template: Template, rotations: bool = True,
+                      reflections: bool = True
+                      ) -> list[tuple[Point, Template]]:
+        """Top-left cell and variant of every match of ``template``."""
+        return [(p, t) for t in template.variants(rotations, reflections)
+                for p in self.points(self.match(t))]
+
+    def points(self, board: int) -> list[Point]:
+        data = board.to_bytes((board.bit_length() + 7) // 8, 'little')
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8),
+                             bitorder='little')
+        ys, xs = np.divmod(np.flatnonzero(bits), self.stride)
+        return [Point(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
@@ -0,0 +1,31 @@
+import pathlib
+
+import pytest
+
+from aoc.runner import DayModule, load_day
+
+ROOT = pathlib.Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture
+def day01(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    module = load_day(DayModule(1, ROOT / 'day01' / 'src' / 'main.py'))
+    yield module
+    monkeypatch.chdir(ROOT)
+
+
+@pytest.mark.parametrize('text, answers', [
+    ('', ['Part 1 0', 'Part 2 0']),
+    ((ROOT / 'day01' / 'example.txt').read_text(),
+     ['Part 1 11', 'Part 2 31']),
+])
+def test_day01_modes_agree(day01, tmp_path, monkeypatch, capsys,
+                           text, answers):
+    path = tmp_path / 'input.txt'
+    path.write_text(text)
+    monkeypatch.setattr(day01, 'INPUT_PATH', str(path))
+    for name, parts in day01.MODES.items():
+        for part in parts:
+            part()
+        assert capsys.readouterr().out.splitlines() == answers, name
@@ -0,0 +1,27 @@
+import pathlib
+import shutil
+
+import pytest
+
+from aoc.generate import write_input
+from aoc.runner import DayModule, run_part
+
+ROOT = pathlib.Path(__file__).resolve().parents[3]
+
+
+def copy_day(day: int, tmp_path: pathlib.Path) -> DayModule:
+    directory = tmp_path / f'day{day:02d}'
+    shutil.copytree(ROOT / directory.name, directory,
+                    ignore=shutil.ignore_patterns('__pycache__'))
+    return DayModule(day, directory / 'main.py')
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_day14_solves_generated_input(tmp_path, monkeypatch, seed):
+    monkeypatch.chdir(tmp_path)
+    day = copy_day(14, tmp_path)
+    write_input(14, day.directory, seed=seed)
+    for part in (1, 2):
+        result = run_part(day, part, 'GENERATED')
+        assert result.error is None, result.error
+        assert result.output
@@ -1,6 +1,28 @@
+import argparse
+import contextlib
+import io
+import itertools
+import os
+import tempfile
+from collections import Counter
+
+from aoc import TimeUnit, benchmark, lazy_import
+
+np = lazy_import('numpy')
+
+INPUT_PATH = '../input.txt'
+# Rows per sorted run in external mode. Parsing a run holds its lines,
+# their joined text and two int64 columns, about 120 bytes per row.
+RUN_ROWS = 200_000
+# Total read buffer shared between all runs during the merge.
+MERGE_BYTES = 16 << 20
+# Most runs of one column merged at once, so the merge never has more
+# than twice this many files open.
+MERGE_FAN_IN = 32
+
 
 def get_input_data():
-    with open('../input.txt') as f:
+    with open(INPUT_PATH) as f:
         lines = [s.strip('\n') for s in f.readlines()]
     lefties = []
     righties = []
@@ -12,6 +34,192 @@ def get_input_data():
     return lefties, righties
 
 
+def parse_columns(data: bytes | str):
+    """Both columns of ``data`` as int64 arrays, parsed in one bulk call."""
+    columns = np.fromstring(data, dtype=np.int64, sep=' ').reshape(-1, 2)
+    return columns[:, 0], columns[:, 1]
+
+
+def get_input_arrays():
+    """Both columns as int64 arrays, parsed by NumPy in one pass."""
+    with open(INPUT_PATH, 'rb') as f:
+        return parse_columns(f.read())
+
+
+def iter_column_chunks(path: str, chunk_rows: int = RUN_ROWS):
+    """Both columns as int64 arrays, ``chunk_rows`` rows at a time."""
+    with open(path, 'rb') as f:
+        while lines := list(itertools.islice(f, chunk_rows)):
+            yield parse_columns(b''.join(lines))
+
+
+def write_sorted_runs(path: str, directory: str,
+                      chunk_rows: int = RUN_ROWS
+                      ) -> tuple[list[str], list[str]]:
+    """Sort each chunk of each column and spill it to its own run file."""
+    runs = ([], [])
+    for n, columns in enumerate(iter_column_chunks(path, chunk_rows)):
+        for side, column, files in zip('lr', columns, runs):
+            run = os.path.join(directory, f'{side}{n}.run')
+            np.sort(column).tofile(run)
+            files.append(run)
+    return runs
+
+
+def merge_runs(runs: list[str], stack: contextlib.ExitStack,
+               buffer_items: int):
+    """Sorted int64 blocks of all of ``runs``, whose files ``stack`` closes.
+
+    Each run keeps a buffer of up to ``buffer_items`` values. Every step
+    emits all buffered values up to the smallest buffer's last value,
+    which no value still on disk can undercut, and refills the buffers
+    that ran dry, so each block is at most the size of all the buffers.
+    """
+    files = [stack.enter_context(open(run, 'rb')) for run in runs]
+    buffers = [np.fromfile(f, dtype=np.int64, count=buffer_items)
+               for f in files]
+    while True:
+        live = [k for k, buffer in enumerate(buffers) if len(buffer)]
+        if not live:
+            return
+        bound = min(buffers[k][-1] for k in live)
+        parts = []
+        for k in live:
+            cut = np.searchsorted(buffers[k], bound, side='right')
+            parts.append(buffers[k][:cut])
+            buffers[k] = buffers[k][cut:]
+            if not len(buffers[k]):
+                buffers[k] = np.fromfile(files[k], dtype=np.int64,
+                                         count=buffer_items)
+        yield np.sort(np.concatenate(parts))
+
+
+def reduce_runs(runs: list[str], fan_in: int = MERGE_FAN_IN) -> list[str]:
+    """Merge ``runs`` ``fan_in`` at a time until ``fan_in`` are left.
+
+    Each merged group is written to a new run next to the old ones, which
+    are deleted, so no more than ``fan_in`` runs are ever open at once.
+    """
+    if fan_in < 2:
+        raise ValueError('fan_in must be at least 2')
+    buffer_items = max(1024, MERGE_BYTES // (8 * 2 * fan_in))
+    passes = 0
+    while len(runs) > fan_in:
+        passes += 1
+        merged = []
+        for k in range(0, len(runs), fan_in):
+            group = runs[k:k + fan_in]
+            if len(group) == 1:
+                merged.extend(group)
+                continue
+            run = f'{os.path.splitext(group[0])[0]}.{passes}.run'
+            with contextlib.ExitStack() as stack, open(run, 'wb') as f:
+                for block in merge_runs(group, stack, buffer_items):
+                    block.tofile(f)
+            for old in group:
+                os.remove(old)
+            merged.append(run)
+        runs = merged
+    return runs
+
+
+def paired_distance(left, right) -> int:
+    """Sum of ``|l - r|`` over two equally long streams of sorted blocks.
+
+    The streams cut their blocks in different places, so the unpaired
+    tail of the longer block is carried into the next step.
+    """
+    total = 0
+    lhs = rhs = np.empty(0, dtype=np.int64)
+    for lhs_block, rhs_block in itertools.zip_longest(left, right):
+        if lhs_block is not None:
+            lhs = np.concatenate((lhs, lhs_block))
+        if rhs_block is not None:
+            rhs = np.concatenate((rhs, rhs_block))
+        n = min(len(lhs), len(rhs))
+        total += int(np.abs(lhs[:n] - rhs[:n]).sum())
+        lhs, rhs = lhs[n:], rhs[n:]
+    if len(lhs) or len(rhs):
+        raise ValueError('the two columns have different lengths')
+    return total
+
+
+def external_sorted_distance(path: str, chunk_rows: int = RUN_ROWS,
+                             directory: str = None,
+                             fan_in: int = MERGE_FAN_IN) -> int:
+    """Part 1 in bounded memory, for inputs that do not fit in RAM.
+
+    The columns are parsed and sorted with NumPy in runs of ``chunk_rows``
+    rows, which are written to a temporary directory and merged back in
+    blocks, so only one run or ``MERGE_BYTES`` of read buffers (and the
+    blocks cut from them) is ever in memory. Each column is first merged
+    down to ``fan_in`` runs, so the final merge of both columns keeps at
+    most ``2 * fan_in`` files open.
+    """
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        lefts, rights = write_sorted_runs(path, tmp, chunk_rows)
+        lefts, rights = reduce_runs(lefts, fan_in), reduce_runs(rights, fan_in)
+        buffer_items = max(1024, MERGE_BYTES // (8 * 4 * max(len(lefts), 1)))
+        with contextlib.ExitStack() as stack:
+            left = merge_runs(lefts, stack, buffer_items)
+            right = merge_runs(rights, stack, buffer_items)
+            return paired_distance(left, right)
+
+
+class SimilarityScore:
+    """Part 2 score that stays current as rows are added to either list.
+
+    Each side keeps a histogram of its values; a new value ``v`` adds
+    ``v`` times its count on the other side, which covers every pair it
+    forms with the rows already seen.
+    """
+
+    def __init__(self, lefties=(), righties=()):
+        self.left_counts = Counter()
+        self.right_counts = Counter()
+        self.score = 0
+        self.add_left(lefties)
+        self.add_right(righties)
+
+    def add_left(self, values):
+        self.score += self._add(Counter(values), self.left_counts,
+                                self.right_counts)
+
+    def add_right(self, values):
+        self.score += self._add(Counter(values), self.right_counts,
+                                self.left_counts)
+
+    def add_rows(self, lefties, righties):
+        self.add_left(lefties)
+        self.add_right(righties)
+
+    @staticmethod
+    def _add(new: Counter, counts: Counter, other: Counter) -> int:
+        counts.update(new)
+        return sum(v * c * other[v] for v, c in new.items() if v in other)
+
+
+def column_counts(column) -> Counter:
+    """A histogram of ``column`` from ``np.unique``, as a ``Counter``.
+
+    ``SimilarityScore`` takes it in place of the values themselves.
+    """
+    values, counts = np.unique(column, return_counts=True)
+    return Counter(dict(zip(values.tolist(), counts.tolist())))
+
+
+def similarity_score_numpy(lefties, righties) -> int:
+    """The part 2 score from one ``np.unique`` histogram of the right list."""
+    lefties = np.asarray(lefties, dtype=np.int64)
+    values, counts = np.unique(np.asarray(righties, dtype=np.int64),
+                               return_counts=True)
+    if not len(values):
+        return 0
+    index = np.searchsorted(values, lefties).clip(max=len(values) - 1)
+    matched = values[index] == lefties
+    return int((lefties[matched] * counts[index[matched]]).sum())
+
+
 def part1():
     lefties, righties = get_input_data()
     lefties.sort()
@@ -24,17 +232,82 @@ def part1():
     print(f'Part 1 {total}')
 
 
+def part1_external(chunk_rows: int = RUN_ROWS, directory: str = None,
+                   fan_in: int = MERGE_FAN_IN):
+    total = external_sorted_distance(INPUT_PATH, chunk_rows, directory,
+                                     fan_in)
+    print(f'Part 1 {total}')
+
+
+def part1_numpy():
+    lefties, righties = get_input_arrays()
+    total = int(np.abs(np.sort(lefties) - np.sort(righties)).sum())
+    print(f'Part 1 {total}')
+
+
 def part2():
     lefties, righties = get_input_data()
-    total = 0
-    for num in lefties:
-        total += num * righties.count(num)
+    total = SimilarityScore(lefties, righties).score
     print(f'Part 2 {total}')
 
 
+def part2_external(chunk_rows: int = RUN_ROWS):
+    score = SimilarityScore()
+    for lefties, righties in iter_column_chunks(INPUT_PATH, chunk_rows):
+        score.add_rows(column_counts(lefties), column_counts(righties))
+    print(f'Part 2 {score.score}')
+
+
+def part2_numpy():
+    lefties, righties = get_input_arrays()
+    print(f'Part 2 {similarity_score_numpy(lefties, righties)}')
+
+
+MODES = {
+    'lists': (part1, part2),
+    'numpy': (part1_numpy, part2_numpy),
+    'external': (part1_external, part2_external),
+}
+
+
+def compare_modes(repeat: int = 5):
+    """Time both parts, parsing included, in every mode on the same input."""
+    def run_parts(parts):
+        for part in parts:
+            part()
+
+    for name, parts in MODES.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, result = benchmark(run_parts, parts, repeat=repeat)
+        print(f'{name}: {result.summary(TimeUnit.ms)}')
+
+
 def main():
-    part1()
-    part2()
+    global INPUT_PATH
+    parser = argparse.ArgumentParser()
+    parser.add_argument('input', nargs='?', default=INPUT_PATH)
+    parser.add_argument('--mode', choices=MODES, default='lists',
+                        help='numpy parses and solves with arrays; '
+                             'external sorts part 1 on disk in bounded '
+                             'memory, for inputs larger than RAM')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='time every mode instead of solving')
+    parser.add_argument('--chunk-rows', type=int, default=RUN_ROWS,
+                        help='rows per sorted run in external mode')
+    parser.add_argument('--tmp-dir', help='where external mode spills runs')
+    parser.add_argument('--fan-in', type=int, default=MERGE_FAN_IN,
+                        help='most runs per column merged at once in '
+                             'external mode')
+    args = parser.parse_args()
+    INPUT_PATH = args.input
+    if args.benchmark:
+        compare_modes()
+    elif args.mode == 'external':
+        part1_external(args.chunk_rows, args.tmp_dir, args.fan_in)
+        part2_external(args.chunk_rows)
+    else:
+        for part in MODES[args.mode]:
+            part()
 
 
 if __name__ == '__main__':
@@ -1,5 +1,20 @@
+import argparse
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc import lazy_import
+
+np = lazy_import('numpy')
+
+INPUT_PATH = './input.txt'
+# Bytes of the file each worker checks at a time in stream mode.
+CHUNK_BYTES = 8 << 20
+
+
 def get_data():
-    with open('./input.txt') as f:
+    with open(INPUT_PATH) as f:
         data = [s.strip('\n') for s in f.readlines()]
     return data
 
@@ -31,54 +46,243 @@ def part1():
     print(f'Part 1: {counter}')
 
 
-def get_diffs(line):
-    diffs = []
-    prev = line.pop(0)
-    for n in line:
-        diffs.append(n-prev)
+def first_bad_step(levels, sign, skip=None):
+    """Index of the level ending the first unsafe step, ignoring ``skip``.
+
+    A step is safe if it moves in the direction of ``sign`` by 1 to 3.
+    """
+    prev = None
+    for i, n in enumerate(levels):
+        if i == skip:
+            continue
+        if prev is not None and not 1 <= (n - prev) * sign <= 3:
+            return i
         prev = n
-    return diffs
+    return None
 
-def check_diffs(diffs):
-    safe = True
-    if all([n < 0 for n in diffs]) or all([n > 0 for n in diffs]):
-        pass
-    else:
-        safe = False
-    unique_diffs = {abs(n) for n in diffs}
-    allowed_diffs = {1, 2, 3}
-    if unique_diffs.issubset(allowed_diffs):
-        pass
-    else:
-        safe = False
-    return safe
 
-def part2():    
+def find_removal(levels):
+    """Index of a level whose removal leaves the report safe, or None.
+
+    For a fixed direction, any removal that works must drop one end of the
+    first unsafe step, so only those two levels are tried, in O(n) overall.
+    A report that is already safe stays safe without its last level.
+    """
+    for sign in (1, -1):
+        bad = first_bad_step(levels, sign)
+        if bad is None:
+            return len(levels) - 1
+        for j in (bad - 1, bad):
+            if first_bad_step(levels, sign, skip=j) is None:
+                return j
+    return None
+
+
+def part2():
     data = get_data()
     counter = 0
     for row in data:
         line = [int(n) for n in row.split()]
-        diffs = get_diffs(line[:])
-        safe = check_diffs(diffs)
-        if not safe:
-            safe = check_tolerance(line[:])
-        if safe:
-            #print(line)
+        if find_removal(line) is not None:
             counter += 1
     print(f'Part 2: {counter}')
 
 
-def check_tolerance(nums):
-    for j, _ in enumerate(nums):
-        new = nums[:]
-        new.pop(j)
-        diffs = get_diffs(new[:])
-        safe = check_diffs(diffs[:])
-        if safe:
-            return True
-    return False
+def load_reports(path=INPUT_PATH):
+    """Every level in one flat int64 array, plus row offsets into it.
+
+    Row ``i`` is ``levels[offsets[i]:offsets[i + 1]]``. Rows are split by
+    counting the numbers before each newline in the raw bytes, so no Python
+    work is done per row. Blank lines are dropped.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    levels = np.fromstring(data, dtype=np.int64, sep=' ')
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    digits = (buffer >= ord('0')) & (buffer <= ord('9'))
+    starts = np.flatnonzero(digits & ~np.r_[False, digits[:-1]])
+    line_ends = np.flatnonzero(buffer == ord('\n'))
+    if len(buffer) and buffer[-1] != ord('\n'):
+        line_ends = np.r_[line_ends, len(buffer)]
+    offsets = np.r_[0, np.searchsorted(starts, line_ends)]
+    return levels, np.unique(offsets)
+
+
+def batch_safety(levels, offsets):
+    """Part 1 safety of every row at once.
+
+    The diffs of the flat array include one step across each row boundary;
+    those are dropped, and a row is safe if none of its remaining steps
+    is outside 1..3 in one of the two directions.
+    """
+    lengths = np.diff(offsets)
+    diffs = np.diff(levels)
+    in_row = np.ones(len(diffs), dtype=bool)
+    in_row[offsets[1:-1] - 1] = False
+    diffs = diffs[in_row]
+    rows = np.repeat(np.arange(len(lengths)), lengths - 1)
+    bad_up = np.bincount(rows, weights=(diffs < 1) | (diffs > 3),
+                         minlength=len(lengths))
+    bad_down = np.bincount(rows, weights=(diffs > -1) | (diffs < -3),
+                           minlength=len(lengths))
+    return (bad_up == 0) | (bad_down == 0)
+
+
+def part1_numpy():
+    levels, offsets = load_reports(INPUT_PATH)
+    print(f'Part 1: {int(batch_safety(levels, offsets).sum())}')
+
+
+def part2_numpy():
+    levels, offsets = load_reports(INPUT_PATH)
+    safe = batch_safety(levels, offsets)
+    counter = int(safe.sum())
+    levels, offsets = levels.tolist(), offsets.tolist()
+    for i in np.flatnonzero(~safe).tolist():
+        if find_removal(levels[offsets[i]:offsets[i + 1]]) is not None:
+            counter += 1
+    print(f'Part 2: {counter}')
+
+
+def count_safe(data):
+    """Reports that are safe for part 1 and for part 2 among ``data``'s lines."""
+    safe, dampened = 0, 0
+    for row in data.splitlines():
+        line = [int(n) for n in row.split()]
+        if not line:
+            continue
+        if first_bad_step(line, 1) is None \
+                or first_bad_step(line, -1) is None:
+            safe += 1
+            dampened += 1
+        elif find_removal(line) is not None:
+            dampened += 1
+    return safe, dampened
+
+
+def count_safe_range(path, start, end):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return count_safe(f.read(end - start))
+
+
+def line_ranges(path, start, end, chunk_bytes=CHUNK_BYTES):
+    """Split ``[start, end)`` into chunks that each end on a line break.
+
+    ``start`` and ``end`` must already be line boundaries (or the ends of
+    the file); each cut is moved forward to just after the next newline.
+    """
+    ranges = []
+    with open(path, 'rb') as f:
+        while start < end:
+            cut = start + chunk_bytes
+            if cut < end:
+                f.seek(cut)
+                f.readline()
+                cut = f.tell()
+            cut = min(cut, end)
+            ranges.append((start, cut))
+            start = cut
+    return ranges
+
+
+def count_safe_parallel(path, start, end, executor, chunk_bytes=CHUNK_BYTES):
+    futures = [executor.submit(count_safe_range, path, a, b)
+               for a, b in line_ranges(path, start, end, chunk_bytes)]
+    safe, dampened = 0, 0
+    for future in futures:
+        a, b = future.result()
+        safe += a
+        dampened += b
+    return safe, dampened
+
+
+def last_line_end(path, start, end, block=1 << 16):
+    """Offset just after the last newline in ``[start, end)``, or ``start``."""
+    with open(path, 'rb') as f:
+        position = end
+        while position > start:
+            size = min(block, position - start)
+            position -= size
+            f.seek(position)
+            i = f.read(size).rfind(b'\n')
+            if i != -1:
+                return position + i + 1
+    return start
+
+
+def stream(jobs=None, chunk_bytes=CHUNK_BYTES):
+    """Both parts, with the file checked in line-aligned chunks in parallel."""
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        safe, dampened = count_safe_parallel(
+            INPUT_PATH, 0, os.path.getsize(INPUT_PATH), executor, chunk_bytes)
+    print(f'Part 1: {safe}')
+    print(f'Part 2: {dampened}')
+
+
+def _ignore_interrupts():
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def follow(jobs=None, chunk_bytes=CHUNK_BYTES, interval=1.):
+    """Like ``stream``, then keep checking lines as they are appended.
+
+    Only complete lines are counted; a partly written last line waits for
+    its newline. If the file shrinks it is taken to have been replaced and
+    is counted again from the start. Runs until interrupted.
+    """
+    position, safe, dampened = 0, 0, 0
+    with ProcessPoolExecutor(max_workers=jobs,
+                             initializer=_ignore_interrupts) as executor:
+        try:
+            while True:
+                size = os.path.getsize(INPUT_PATH)
+                if size < position:
+                    position, safe, dampened = 0, 0, 0
+                end = last_line_end(INPUT_PATH, position, size)
+                if end > position:
+                    a, b = count_safe_parallel(INPUT_PATH, position, end,
+                                               executor, chunk_bytes)
+                    position = end
+                    safe += a
+                    dampened += b
+                    print(f'Part 1: {safe}  Part 2: {dampened}', flush=True)
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+
+MODES = {
+    'rows': (part1, part2),
+    'numpy': (part1_numpy, part2_numpy),
+    'stream': (stream,),
+}
+
+
+def main():
+    global INPUT_PATH
+    parser = argparse.ArgumentParser()
+    parser.add_argument('input', nargs='?', default=INPUT_PATH)
+    parser.add_argument('--mode', choices=MODES, default='rows',
+                        help='numpy checks every report at once and only '
+                             'runs the dampener on the unsafe ones; stream '
+                             'checks chunks of the file in parallel')
+    parser.add_argument('-f', '--follow', action='store_true',
+                        help='stream mode, then keep counting lines as they '
+                             'are appended to the file')
+    parser.add_argument('-j', '--jobs', type=int,
+                        help='worker processes for stream mode')
+    parser.add_argument('--chunk-bytes', type=int, default=CHUNK_BYTES)
+    args = parser.parse_args()
+    INPUT_PATH = args.input
+    if args.follow:
+        follow(args.jobs, args.chunk_bytes)
+    elif args.mode == 'stream':
+        stream(args.jobs, args.chunk_bytes)
+    else:
+        for part in MODES[args.mode]:
+            part()
 
 
 if __name__ == '__main__':
-    part1()
-    part2()
+    main()
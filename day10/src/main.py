@@ -1,3 +1,4 @@
+from aoc import bfs
 from dataclasses import dataclass
 from enum import Enum
 
@@ -81,18 +82,9 @@ class HikingMap:
         return total
 
     def bfs(self, start: Tile, end_height: str) -> set[Tile]:
-        explored: set[Tile] = {start}
-        queue: set[Tile] = {start}
-        end_points: set[Tile] = set()
-        while len(queue) > 0:
-            v = queue.pop()
-            if v.height == end_height:
-                end_points.add(v)
-            for neighbor in v.get_possible_adjacent_tiles():
-                if neighbor in self.tiles and neighbor not in explored:
-                    explored.add(neighbor)
-                    queue.add(neighbor)
-        return end_points
+        result = bfs(start, lambda v: [n for n in v.get_possible_adjacent_tiles()
+                                       if n in self.tiles])
+        return {t for t in result.distances if t.height == end_height}
 
     def bfs2(self, start: Tile, end_height: str) -> tuple[set[Tile], list[list[Tile]]]:
         explored: set[Tile] = {start}
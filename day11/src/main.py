@@ -1,63 +1,7 @@
+from aoc import long_multiply
 from typing import Tuple
 
 
-def scalar_digit_multiply(number: list[int], digit: int):
-    result = []
-    carry = 0
-    for n in reversed(number):
-        ans = str(n * digit + carry)
-        if len(ans) > 1:
-            carry = int(ans[:-1])
-            ans = ans[-1]
-        else:
-            carry = 0
-        result.insert(0, int(ans))
-    if carry > 0:
-        result.insert(0, carry)
-    return result
-
-
-def long_sum(data: list[list[int]]) -> tuple[int]:
-    carry = 0
-    result = []
-    while any([len(row) > 0 for row in data]):
-        total = sum([row.pop() for row in data if len(row) > 0])
-        ans = str(total + carry)
-        if len(ans) > 1:
-            carry = int(ans[:-1])
-            ans = ans[-1]
-        else:
-            carry = 0
-        result.insert(0, int(ans))
-    if carry > 0:
-        result.insert(0, carry)
-    return tuple(result)
-
-
-def long_multiply(num1: tuple[int, ...], num2: tuple[int, ...]) -> tuple[int]:
-    """Long multiplication.
-
-    Equivalent to,
-
-        num1
-    x   num2
-    --------
-    ........
-    --------
-
-    :param num1:
-    :param num2:
-    :return:
-    """
-    results = []
-    for i, n in enumerate(reversed(num2)):
-        result = scalar_digit_multiply(num1, n)
-        result.extend([0 for _ in range(i)])
-        results.append(result)
-
-    return long_sum(results)
-
-
 def strip_leading_zeroes(number: tuple[int, ...]) -> tuple[int, ...]:
     new_num = []
     first_digit_reached = False
@@ -136,7 +80,7 @@ def find_number_of_stones_after(blinks: int) -> int:
             if new_num not in new_counts:
                 new_counts[new_num] = 0
             new_counts[new_num] += old_number_counts[number]
-        old_number_counts = new_counts.copy()
+        old_number_counts = new_counts
     return sum([v for v in old_number_counts.values()])
 
 
@@ -1,7 +1,6 @@
+from aoc import Grid, InputType, parse_file
 from dataclasses import dataclass
 from enum import Enum
-from shapely.geometry import Polygon
-import polygons
 
 
 class Direction(Enum):
@@ -45,16 +44,13 @@ class Tile:
         return {Tile(p, plant) for p in self.point.nearby_points()}
 
 
-def parse():
-    with open('./input.txt') as f:
-        data = [[c for c in s.strip('\n')] for s in f.readlines()]
-        tiles = {Tile(Point(i, j), c) for j, row in enumerate(data) for i, c in enumerate(row)}
-    return Garden(tiles)
+def parse(input_type: InputType = InputType.INPUT):
+    return Garden(parse_file(input_type, as_grid=True))
 
 
 @dataclass
 class Garden:
-    tiles: set[Tile]
+    plots: Grid
     _areas: list[set[Tile]] = None
 
     @property
@@ -64,26 +60,24 @@ class Garden:
         return self._areas
 
     def find_areas(self):
-        counted = set()
-        uncounted = self.tiles.copy()
-        while len(self.tiles) != len(counted):
-            start_tile = uncounted.pop()
-            new_area = {start_tile}
-            final_area = {start_tile}
-            counted.add(start_tile)
-            counter = 0
+        plots = self.plots
+        cells = plots.cells
+        counted = bytearray(len(plots))
+        for start in range(len(plots)):
+            if counted[start]:
+                continue
+            plant = cells[start]
+            counted[start] = 1
+            new_area = [start]
+            final_area = set()
             while new_area:
-                tile = new_area.pop()
-                current_plant = tile.plant
-                for neighbor in tile.point.nearby_points():
-                    neighbor_tile = Tile(neighbor, current_plant)
-                    if neighbor_tile in self.tiles and neighbor_tile not in counted:
-                        counted.add(neighbor_tile)
-                        new_area.add(neighbor_tile)
-                        final_area.add(neighbor_tile)
-                    else:
-                        counter += 1
-            uncounted -= final_area
+                index = new_area.pop()
+                final_area.add(Tile(Point(*plots.coords(index)),
+                                    plots.char(plant)))
+                for neighbor in plots.neighbor_indices(index):
+                    if not counted[neighbor] and cells[neighbor] == plant:
+                        counted[neighbor] = 1
+                        new_area.append(neighbor)
             self.areas.append(final_area)
 
     def find_fencing_cost(self) -> int:
@@ -148,13 +142,13 @@ class Garden:
             total += cost
         return total
 
-def part1():
-    garden = parse()
+def part1(input_type: InputType = InputType.INPUT):
+    garden = parse(input_type)
     print(f'Part 1: {garden.find_fencing_cost()}')
 
 
-def part2():
-    garden = parse()
+def part2(input_type: InputType = InputType.INPUT):
+    garden = parse(input_type)
     print(f'Part 2: {garden.find_bulk_fencing_cost()}')
 
 
@@ -5,6 +5,7 @@ from enum import Enum
 class InputType(Enum):
     INPUT = 0,
     EXAMPLE = 1,
+    GENERATED = 2,
 
 
 @dataclass(frozen=True)
@@ -74,7 +75,7 @@ class Security:
     @property
     def grid(self) -> Vector:
         if self._grid is None:
-            if self.input_type == InputType.INPUT:
+            if self.input_type in (InputType.INPUT, InputType.GENERATED):
                 self._grid = Vector(101, 103)
             else:
                 self._grid = Vector(11, 7)
@@ -138,6 +139,8 @@ def parse(input_type: InputType):
             filepath = './input.txt'
         case InputType.EXAMPLE:
             filepath = './example.txt'
+        case InputType.GENERATED:
+            filepath = './generated.txt'
         case _:
             raise ValueError
 
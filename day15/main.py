@@ -1,36 +1,10 @@
+import aoc
+from aoc import Direction, FrameRecorder, Grid, InputType, parse_file
 from dataclasses import dataclass
-from enum import Enum
 
 
-class InputType(Enum):
-    INPUT = 0,
-    EXAMPLE = 1,
-    EXAMPLE2 = 2,
-    EXAMPLE3 = 3,
-
-
-class Direction(Enum):
-    N = 1
-    E = 2
-    W = 3
-    S = 4
-
-
-@dataclass(frozen=True)
-class Point:
-    x: int
-    y: int
-
-    def point_in_direction(self, direction: Direction) -> 'Point':
-        match direction:
-            case Direction.N:
-                return Point(self.x, self.y-1)
-            case Direction.E:
-                return Point(self.x+1, self.y)
-            case Direction.W:
-                return Point(self.x-1, self.y)
-            case Direction.S:
-                return Point(self.x, self.y+1)
+class Point(aoc.Point):
+    __slots__ = ()
 
     def big_boxes_in_direction(self, direction: Direction) -> 'set[BigBox]':
         match direction:
@@ -93,37 +67,41 @@ class BigBox:
                             Point(self.points[1].x + 1, self.points[1].y + 1)))})
         return boxes
 
+def walls_from_rows(rows: list[str]) -> Grid:
+    """The map with only its walls left; boxes and the robot move."""
+    walls = Grid.from_rows(rows)
+    for c in '[]O@':
+        for i in walls.indices_of(c):
+            walls.cells[i] = walls.code('.')
+    return walls
+
+
+def is_wall(walls: Grid, p: Point) -> bool:
+    return walls.cells[walls.index(p.x, p.y)] == walls.code('#')
+
+
+@dataclass
 class Warehouse:
-    blocks: set[Point]
+    blocks: Grid
     boxes: set[Point]
     robot: Point
 
     @classmethod
     def from_rows(cls, rows: list[str]) -> 'Warehouse':
         robot = None
-        blocks = set()
         boxes = set()
         for j, row in enumerate(rows):
             for i, c in enumerate(row):
                 p = Point(i, j)
                 match c:
-                    case '#':
-                        blocks.add(p)
                     case 'O':
                         boxes.add(p)
                     case '@':
                         robot = Point(i, j)
-        return cls(blocks, boxes, robot)
+        return cls(walls_from_rows(rows), boxes, robot)
 
     def visualise(self):
-        imax = 0
-        jmax = 0
-        for block in self.blocks:
-            imax = max(imax, block.x)
-            jmax = max(jmax, block.y)
-        grid = [['.' for _ in range(imax+1)] for k in range(jmax+1)]
-        for block in self.blocks:
-            grid[block.y][block.x] = '#'
+        grid = [list(row) for row in str(self.blocks).split('\n')]
         for box in self.boxes:
             grid[box.y][box.x] = 'O'
         grid[self.robot.y][self.robot.x] = '@'
@@ -139,7 +117,7 @@ class Warehouse:
             next_box = new_point
             while next_box in self.boxes:
                 next_box = next_box.point_in_direction(direction)
-                if next_box in self.blocks:
+                if is_wall(self.blocks, next_box):
                     return False
                 elif next_box not in self.boxes:
                     self.boxes.add(next_box)
@@ -148,7 +126,7 @@ class Warehouse:
                 else:
                     pass
 
-        if new_point in self.blocks:
+        if is_wall(self.blocks, new_point):
             return False
         self.robot = new_point
         return True
@@ -166,36 +144,25 @@ class Warehouse:
 
 @dataclass
 class BigWarehouse:
-    blocks: set[Point]
+    blocks: Grid
     boxes: set[BigBox]
     robot: Point
 
     @classmethod
     def from_rows(cls, rows: list[str]) -> 'BigWarehouse':
         robot = None
-        blocks = set()
         boxes = set()
         for j, row in enumerate(rows):
             for i, c in enumerate(row):
-                p = Point(i, j)
                 match c:
-                    case '#':
-                        blocks.add(p)
                     case '[':
                         boxes.add(BigBox((Point(i, j), Point(i+1, j))))
                     case '@':
                         robot = Point(i, j)
-        return cls(blocks, boxes, robot)
+        return cls(walls_from_rows(rows), boxes, robot)
 
     def visualise(self):
-        imax = 0
-        jmax = 0
-        for block in self.blocks:
-            imax = max(imax, block.x)
-            jmax = max(jmax, block.y)
-        grid = [['.' for _ in range(imax+1)] for k in range(jmax+1)]
-        for block in self.blocks:
-            grid[block.y][block.x] = '#'
+        grid = [list(row) for row in str(self.blocks).split('\n')]
         for big_box in self.boxes:
             grid[big_box.points[0].y][big_box.points[0].x] = '['
             grid[big_box.points[1].y][big_box.points[1].x] = ']'
@@ -214,7 +181,7 @@ class BigWarehouse:
         new_robot_point = self.robot.point_in_direction(direction)
         box_in_way = {b for b in self.boxes if new_robot_point in b.points}
         affected_boxes = set()
-        if new_robot_point in self.blocks:
+        if is_wall(self.blocks, new_robot_point):
             return False
         while box_in_way:
             current_box = box_in_way.pop()
@@ -227,7 +194,7 @@ class BigWarehouse:
                         direction)
                 case _:
                     raise ValueError
-            if new_point in self.blocks:
+            if is_wall(self.blocks, new_point):
                 return False
             box_in_way = {b for b in self.boxes if new_point in b.points}
 
@@ -243,30 +210,46 @@ class BigWarehouse:
         affected_boxes = set()
         possible_boxes = self.robot.big_boxes_in_direction(direction)
         boxes = possible_boxes.intersection(self.boxes)
-        while boxes and not {p for b in boxes for p in b.points}.intersection(self.blocks):
+        while boxes and not any(is_wall(self.blocks, p)
+                                for b in boxes for p in b.points):
             affected_boxes.update(boxes)
             possible_boxes = set()
             for b in boxes:
                 possible_boxes.update(b.possible_boxes_vertically(direction))
             pure_vertical_box_points = {p for b in boxes for p in b.box_in_vertical_direction(direction).points}
-            if pure_vertical_box_points.intersection(self.blocks):
+            if any(is_wall(self.blocks, p) for p in pure_vertical_box_points):
                 return False
             boxes = possible_boxes.intersection(self.boxes)
         new_boxes = {a.box_in_vertical_direction(direction) for a in affected_boxes}
         self.boxes -= affected_boxes
         self.boxes.update(new_boxes)
-        if new_point in self.blocks:
+        if is_wall(self.blocks, new_point):
             return False
         self.robot = new_point
         return True
 
-    def apply_sequence_of_moves(self, moves: list[Direction]) -> None:
-
-        for i, move in enumerate(moves):
-            result = self.visualise() + '\n' + f'{i} - Next move: {move}\n'
-            with open(f'./output_results/input_output{i:05}.txt', 'w') as f:
-                f.write(result)
-            self.move_robot(direction=move)
+    def apply_sequence_of_moves(self, moves: list[Direction],
+                                frames_path: str = './output_results/moves.frames',
+                                every: int = 1) -> None:
+        if frames_path is None:
+            for move in moves:
+                self.move_robot(direction=move)
+            return
+        with FrameRecorder.from_rows(frames_path,
+                                     self.visualise().split('\n'),
+                                     every=every) as recorder:
+            for i, move in enumerate(moves):
+                recorder.snapshot(f'{i} - Next move: {move}')
+                robot, boxes = self.robot, self.boxes.copy()
+                self.move_robot(direction=move)
+                recorder[robot] = '.'
+                for big_box in boxes - self.boxes:
+                    recorder[big_box.points[0]] = '.'
+                    recorder[big_box.points[1]] = '.'
+                for big_box in self.boxes - boxes:
+                    recorder[big_box.points[0]] = '['
+                    recorder[big_box.points[1]] = ']'
+                recorder[self.robot] = '@'
 
     def calculate_gps_score(self):
         total = 0
@@ -294,23 +277,10 @@ def parse_moves(string):
 
 
 def parse(input_type: InputType, big_warehouse: bool = False):
-    match input_type:
-        case InputType.INPUT:
-            filepath = './input.txt'
-        case InputType.EXAMPLE:
-            filepath = './example.txt'
-        case InputType.EXAMPLE2:
-            filepath = './example2.txt'
-        case InputType.EXAMPLE3:
-            filepath = './example3.txt'
-        case _:
-            raise ValueError
-
-    with open(filepath) as f:
-        data = [s.strip('\n') for s in f.readlines()]
-        warehouse = [s for s in data if '#' in s]
-        moves = [s for s in data if set('<^>v').intersection(set(s))]
-        all_moves = ''.join(moves)
+    data = parse_file(input_type)
+    warehouse = [s for s in data if '#' in s]
+    moves = [s for s in data if set('<^>v').intersection(set(s))]
+    all_moves = ''.join(moves)
 
     if big_warehouse:
         data = []
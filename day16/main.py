@@ -1,61 +1,15 @@
+import aoc
+from aoc import (cached_parse, dijkstra, Direction, FrameRecorder, Grid,
+                 InputType, parse_file)
 from dataclasses import dataclass
-from enum import Enum
+import contextlib
 import math
 
 
-class InputType(Enum):
-    INPUT = 0,
-    EXAMPLE = 1,
-    EXAMPLE2 = 2,
-    EXAMPLE3 = 3,
-    EXAMPLE4 = 4,
-
-class Direction(Enum):
-    N = 1
-    E = 2
-    W = 3
-    S = 4
-
-    def rotate_clockwise(self):
-        match self:
-            case Direction.N:
-                return Direction.E
-            case Direction.E:
-                return Direction.S
-            case Direction.S:
-                return Direction.W
-            case Direction.W:
-                return Direction.N
-
-    def rotate_anticlockwise(self):
-        match self:
-            case Direction.N:
-                return Direction.W
-            case Direction.E:
-                return Direction.N
-            case Direction.S:
-                return Direction.E
-            case Direction.W:
-                return Direction.S
-
-
 START_DIRECTION = Direction.E
 
-@dataclass(frozen=True)
-class Point:
-    x: int
-    y: int
-
-    def point_in_direction(self, direction: Direction) -> 'Point':
-        match direction:
-            case Direction.N:
-                return Point(self.x, self.y-1)
-            case Direction.E:
-                return Point(self.x+1, self.y)
-            case Direction.W:
-                return Point(self.x-1, self.y)
-            case Direction.S:
-                return Point(self.x, self.y+1)
+class Point(aoc.Point):
+    __slots__ = ()
 
     def neighbor_points(self, direction: Direction, score: int) -> 'set[tuple[Point, int, Direction]]':
         return {(self.point_in_direction(direction), score + 1, direction),
@@ -71,115 +25,82 @@ class Point:
 
 @dataclass
 class Maze:
-    paths: set[Point]
+    grid: Grid
     start: Point
     end: Point
-    walls: set[Point]
     best_paths: dict[tuple[Point,int, Direction], set[tuple[Point, int, Direction]]] = None
 
     @classmethod
-    def from_rows(cls, rows: list[str]):
-        paths = set()
-        walls = set()
-        start, end = None, None
-        for j, row in enumerate(rows):
-            for i, c in enumerate(row):
-                p = Point(i, j)
-                match c:
-                    case '#':
-                        walls.add(p)
-                    case '.':
-                        paths.add(p)
-                    case 'S':
-                        start = p
-                    case 'E':
-                        end = p
-        paths.add(start)
-        paths.add(end)
-        return cls(paths, start, end, walls)
+    def from_grid(cls, grid: Grid):
+        start = Point(*grid.coords(grid.indices_of('S')[0]))
+        end = Point(*grid.coords(grid.indices_of('E')[0]))
+        return cls(grid, start, end)
+
+    def is_open(self, point: Point) -> bool:
+        grid = self.grid
+        return grid.cells[grid.index(point.x, point.y)] != grid.code('#')
 
     def find_lowest_score(self):
-        queue = []
-        explored = {(self.start, START_DIRECTION): 0}
-        queue.append((self.start, 0, START_DIRECTION))
-        paths: dict[tuple[Point, int, Direction], set[tuple[Point, int, Direction]]] = {}
-        possible_scores = []
-        while queue:
-            prev_point = queue.pop(0)
-            v, score, direction = prev_point
-            if v == self.end:
-                possible_scores.append(score)
-                queue = [p for p in queue if p[1] <= possible_scores[-1]]
-                continue
-            for point in {p for p in v.neighbor_points(direction, score) if p[0] in self.paths}:
-                key = (point[0], point[-1])
-                if key not in explored or explored[key] >= point[1]:
-                    explored[key] = point[1]
-                    if point not in paths:
-                        paths[point] = {prev_point}
-                    else:
-                        paths[point].add(prev_point)
-                    queue.append(point)
-        self.best_paths = paths
-        return min(possible_scores)
+        def neighbors(state: tuple[Point, Direction]):
+            v, direction = state
+            for point, cost, new_direction in v.neighbor_points(direction, 0):
+                if self.is_open(point):
+                    yield (point, new_direction), cost
+
+        result = dijkstra((self.start, START_DIRECTION), neighbors,
+                          is_goal=lambda state: state[0] == self.end,
+                          all_predecessors=True)
+        distances = result.distances
+        self.best_paths = {
+            (p, distances[(p, d)], d): {(q, distances[(q, e)], e)
+                                       for q, e in previous}
+            for (p, d), previous in result.predecessors.items()}
+        return distances[result.goal]
 
     def visualise(self, tiles: set[Point]) -> str:
-        imax = 0
-        jmax = 0
-        for block in self.walls:
-            imax = max(imax, block.x)
-            jmax = max(jmax, block.y)
-        grid = [['.' for _ in range(imax + 1)] for k in range(jmax + 1)]
-        for block in self.walls:
-            grid[block.y][block.x] = '#'
+        grid = [['#' if c == '#' else '.' for c in row]
+                for row in str(self.grid).split('\n')]
         for box in tiles:
             grid[box.y][box.x] = 'O'
         rows = [''.join(row) for row in grid]
         string = '\n'.join(rows)
         return string
 
-    def count_optimal_tiles(self, score: int) -> int:
+    def count_optimal_tiles(self, score: int,
+                            frames_path: str = './output/steps.frames',
+                            every: int = 1) -> int:
         if self.best_paths is None:
             self.find_lowest_score()
 
         tiles = {(self.end, score, d) for d in Direction}
         best_tiles = {self.start}
-        counter = 0
-        string = self.visualise(best_tiles)
-        with open(f'./output/step_{counter:05d}.txt', 'w') as file:
-            file.write(string)
-        while tiles:
-            next_tiles = {t for t in tiles if t in self.best_paths}
-            new_tiles = set()
-            counter += 1
-            for t in next_tiles:
-                best_tiles.add(t[0])
-                new_tiles.update(self.best_paths[t])
-            tiles = new_tiles
-            with open(f'./output/step_{counter:05d}.txt', 'w') as file:
-                string = self.visualise(best_tiles)
-                file.write(string)
+        recorder = None
+        if frames_path is not None:
+            recorder = FrameRecorder.from_rows(
+                frames_path, self.visualise(best_tiles).split('\n'),
+                every=every)
+        with recorder or contextlib.nullcontext():
+            if recorder is not None:
+                recorder.snapshot('step 0')
+            counter = 0
+            while tiles:
+                next_tiles = {t for t in tiles if t in self.best_paths}
+                new_tiles = set()
+                counter += 1
+                for t in next_tiles:
+                    best_tiles.add(t[0])
+                    new_tiles.update(self.best_paths[t])
+                    if recorder is not None:
+                        recorder[t[0]] = 'O'
+                tiles = new_tiles
+                if recorder is not None:
+                    recorder.snapshot(f'step {counter}')
         return len(best_tiles)
 
 
+@cached_parse(version=2)
 def parse(input_type: InputType, big_warehouse: bool = False):
-    match input_type:
-        case InputType.INPUT:
-            filepath = './input.txt'
-        case InputType.EXAMPLE:
-            filepath = './example.txt'
-        case InputType.EXAMPLE2:
-            filepath = './example2.txt'
-        case InputType.EXAMPLE3:
-            filepath = './example3.txt'
-        case InputType.EXAMPLE4:
-            filepath = './example4.txt'
-        case _:
-            raise ValueError
-
-    with open(filepath) as f:
-        data = [s.strip('\n') for s in f.readlines()]
-    maze = Maze.from_rows(data)
+    maze = Maze.from_grid(parse_file(input_type, as_grid=True))
     return maze
 
 
@@ -1,4 +1,4 @@
-from aoc import Direction, Point, parse_file, InputType, timer, TimeUnit
+from aoc import Direction, Point, parse_file, InputType, timer, TimeUnit, bfs, make_grid, grid_neighbors, PointCodec
 
 
 class MemorySpace:
@@ -9,31 +9,27 @@ class MemorySpace:
         jmax = max([p.y for p in byte_positions])
         self.end: Point = Point(imax, jmax)
         self.start: Point = Point(0, 0)
-        self.grid = {Point(i, j) for i in range(imax+1) for j in range(jmax+1)}
+        self.width, self.height = imax+1, jmax+1
+        self.codec = PointCodec(self.width, self.height)
+
+    def blocks_at_time(self, t: int):
+        """Sparse while few bytes have fallen, dense once many have."""
+        return make_grid(self.width, self.height,
+                         {p: '#' for p in self.byte_positions[:t]})
 
     def find_shortest_path_to_end_at_time(self, t: int = 1024):
-        blocks = set(self.byte_positions[:t])
-        queue = []
-        explored = {self.start}
-        paths: dict[Point, Point] = {}
-        queue.append(self.start)
-        while queue:
-            square = queue.pop(0)
-            if square == self.end:
-                return True, paths
-            available_neighbors = square.immediate_neighbors - blocks
-            allowed_neighbors = available_neighbors.intersection(self.grid)
-            unexplored_neighbors = allowed_neighbors - explored
-            for neighbor in unexplored_neighbors:
-                explored.add(neighbor)
-                paths[neighbor] = square
-                queue.append(neighbor)
-        return False, paths
+        """BFS over packed ``y * width + x`` ints rather than Points."""
+        blocks = self.blocks_at_time(t)
+        end = self.codec.pack(self.end)
+        result = bfs(self.codec.pack(self.start), grid_neighbors(blocks, '.'),
+                     is_goal=lambda i: i == end)
+        return result.found, result.predecessors
 
-    def get_path_from_dict(self, paths: dict[Point, Point]):
-        path = {self.end}
-        p = paths[self.end]
-        while p != self.start:
+    def get_path_from_dict(self, paths: dict[int, int]) -> set[int]:
+        start, end = self.codec.pack(self.start), self.codec.pack(self.end)
+        path = {end}
+        p = paths[end]
+        while p != start:
             p = paths[p]
             path.add(p)
         return path
@@ -49,7 +45,7 @@ class MemorySpace:
         while success:
             t += 1
             new_byte = self.byte_positions[t-1]
-            if new_byte in path:
+            if self.codec.pack(new_byte) in path:
                 success, paths = self.find_shortest_path_to_end_at_time(t)
                 if success:
                     path = self.get_path_from_dict(paths)
@@ -1,9 +1,13 @@
-from aoc import parse_file, InputType, timer, TimeUnit
+from aoc import (parse_file, InputType, timer, TimeUnit, memoize,
+                 HashedTuple)
 from dataclasses import dataclass
-import functools
 
+# Enough for every suffix of every pattern in a real input; the towels are
+# passed as a HashedTuple so they are not re-hashed on each lookup.
+MEMO_SIZE = 1 << 16
 
-@functools.cache
+
+@memoize(maxsize=MEMO_SIZE)
 def is_pattern_possible(pattern: str, towels: tuple[str, ...]):
     if len(pattern) == 0:
         return True
@@ -14,7 +18,7 @@ def is_pattern_possible(pattern: str, towels: tuple[str, ...]):
     return possible
 
 
-@functools.cache
+@memoize(maxsize=MEMO_SIZE)
 def count_ways(pattern: str, towels: tuple[str, ...]) -> int:
     if len(pattern) == 0:
         return 1
@@ -32,16 +36,18 @@ class Onsen:
 
     def find_num_possible_patterns(self):
         counter = 0
+        towels = HashedTuple(self.towels)
         for p in self.patterns:
-            if is_pattern_possible(p, tuple(self.towels)):
+            if is_pattern_possible(p, towels):
                 counter += 1
         return counter
 
     def find_num_possible_arrangements(self):
         total = 0
+        towels = HashedTuple(self.towels)
         for p in self.patterns:
-            if is_pattern_possible(p, tuple(self.towels)):
-                count = count_ways(p, tuple(self.towels))
+            if is_pattern_possible(p, towels):
+                count = count_ways(p, towels)
                 total += count
         return total
 
@@ -1,4 +1,4 @@
-from aoc import parse_file, InputType, timer, TimeUnit, Point, visualise
+from aoc import parse_file, InputType, timer, TimeUnit, Point, cached_parse, Grid
 from dataclasses import dataclass
 
 
@@ -18,7 +18,7 @@ class CheatPair:
 
 @dataclass
 class RaceTrack:
-    obstacles: set[Point]
+    grid: Grid
     track: list[Point]
     start: Point
     end: Point
@@ -33,12 +33,7 @@ class RaceTrack:
         for t, point in enumerate(self.track):
             if t % 10 == 0:
                 print(f'Track completion {t}/{length}')
-            steps = 2
-            all_cheat_potentials = set()
-            while steps <= cheat_time:
-                cheat_potentials = point.immediate_neighbors_after(steps=steps)
-                all_cheat_potentials = all_cheat_potentials.union(cheat_potentials)
-                steps += 1
+            all_cheat_potentials = set(point.points_within_distance(cheat_time))
             track_set = set(self.track[t:])
             possibilities = all_cheat_potentials.intersection(track_set)
             print(len(possibilities))
@@ -61,60 +56,30 @@ class RaceTrack:
         return cheats
 
     def visualise(self, cheats: list[Cheat]):
-        all_points = self.obstacles.union(set(self.track))
-        char_map = {}
-        c = None
-        for p in all_points:
-            if p in self.track:
-                c = '.'
-            if p in self.obstacles:
-                c = '#'
-            if p == self.start:
-                c = 'S'
-            if p == self.end:
-                c = 'E'
-            for cheat in cheats:
-                if p == cheat.coord1:
-                    c = '0'
-                if p == cheat.coord2:
-                    c = '2'
-            if c is None:
-                raise ValueError
-            char_map[p] = c
-        visualise(char_map, print_=True)
+        grid = self.grid.copy()
+        for cheat in cheats:
+            grid[cheat.coord1] = '0'
+            grid[cheat.coord2] = '2'
+        print(grid)
         print()
 
 
+@cached_parse(version=1)
 def parse(input_type: InputType):
-    obstacles = set()
-    track = set()
-    start = None
-    end = None
-    data = parse_file(input_type)
-    for j, row in enumerate(data):
-        for i, c in enumerate(row):
-            p = Point(i, j)
-            match c:
-                case '#':
-                    obstacles.add(p)
-                case '.':
-                    track.add(p)
-                case 'S':
-                    start = p
-                    track.add(p)
-                case 'E':
-                    end = p
-                    track.add(p)
-                case _:
-                    raise ValueError
+    grid = parse_file(input_type, as_grid=True)
+    cells, wall = grid.cells, grid.code('#')
+    start = grid.find('S')
+    end = grid.find('E')
     course = [start]
-    square = start
+    previous, square = None, start
     while square != end:
-        squares = square.immediate_neighbors.intersection(track) - set(course)#
+        squares = [p for p in square.immediate_neighbors
+                   if p != previous and grid.in_bounds(p.x, p.y)
+                   and cells[grid.index(p.x, p.y)] != wall]
         assert len(squares) <= 1
-        square = squares.pop()
+        previous, square = square, squares[0]
         course.append(square)
-    return RaceTrack(obstacles, course, start, end)
+    return RaceTrack(grid, course, start, end)
 
 
 @timer(TimeUnit.s)
@@ -1,4 +1,4 @@
-from aoc import parse_file, InputType, timer, TimeUnit
+from aoc import parse_file, InputType, timer, TimeUnit, cached_parse
 from dataclasses import dataclass
 import csv
 
@@ -117,23 +117,25 @@ class MonkeyMarket:
 
 
 
-@timer(TimeUnit.s)
-def part1(input_type: InputType):
+@cached_parse(version=1)
+def simulate_market(input_type: InputType, steps: int = 2000) -> MonkeyMarket:
     data = parse_file(input_type)
     secrets = [int(row) for row in data]
     market = MonkeyMarket(secrets)
-    secrets = market.numbers_after(2000)
-    print(f'Part 1: {sum(secrets)}')
+    market.numbers_after(steps)
+    return market
+
+
+@timer(TimeUnit.s)
+def part1(input_type: InputType):
+    market = simulate_market(input_type)
+    print(f'Part 1: {sum(market.secrets)}')
 
 
 @timer(TimeUnit.s)
 def part2(input_type: InputType):
-    #data = parse_file(input_type)
-    #secrets = [int(row) for row in data]
-    #market = MonkeyMarket(secrets)
-    #secrets = market.numbers_after(2000)
-    #market.save_prices(input_type)
-    mh = MarketHistory.from_file(input_type)
+    market = simulate_market(input_type)
+    mh = MarketHistory(market.prices)
     sequences = mh.find_sequence_values()
     print(f'Part 2: {mh.find_max_available_bananas()}')
 
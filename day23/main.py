@@ -1,5 +1,6 @@
-from aoc import parse_file, InputType, timer, TimeUnit
-import networkx as nx
+from aoc import parse_file, InputType, timer, TimeUnit, lazy_import
+
+nx = lazy_import('networkx')
 
 
 def parse(input_type: InputType):
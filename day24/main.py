@@ -1,9 +1,9 @@
-from aoc import TimeUnit, parse_file, InputType, timer
+from aoc import TimeUnit, iter_lines, InputType, timer, lazy_import
 from enum import Enum
 from dataclasses import dataclass
-import networkx as nx
-import matplotlib.pyplot as plt
-from pyvis.network import Network as PVNetwork
+
+nx = lazy_import('networkx')
+pyvis_network = lazy_import('pyvis.network')
 
 
 class Operator(Enum):
@@ -53,12 +53,14 @@ class Command:
 
 
 def parse(input_type: InputType):
-    data = parse_file(input_type)
-    starting_vals = [row.split(':') for row in data if ':' in row]
-    values = {v[0].strip(): int(v[1]) for v in starting_vals}
-    operations = [row.split(' -> ')  for row in data if '->' in row]
-    operations = [Command.from_string(op) for op in
-                  operations]
+    values = {}
+    operations = []
+    for row in iter_lines(input_type):
+        if ':' in row:
+            name, value = row.split(':')
+            values[name.strip()] = int(value)
+        elif '->' in row:
+            operations.append(Command.from_string(row.split(' -> ')))
     for op in operations:
         values[op.result] = None
     return operations, values
@@ -92,7 +94,7 @@ def values_to_int(n_vals):
 
 
 def visualise(network):
-    net = PVNetwork()
+    net = pyvis_network.Network()
     for k, v in network.nodes.items():
         net.add_node(k)
     for k, v in network.nodes.items():
@@ -140,7 +142,7 @@ def part2(input_type: InputType):
         res = op.result
         graph.add_edge(op.variables[0], res)
         graph.add_edge(op.variables[1], res)
-    nt = PVNetwork('1000px', '2000px',
+    nt = pyvis_network.Network('1000px', '2000px',
                    select_menu = True,
                    filter_menu = True)
     nt.show_buttons(filter_=["physics"])
@@ -1,4 +1,4 @@
-from aoc import InputType, parse_file, timer, TimeUnit
+from aoc import InputType, iter_records, timer, TimeUnit
 from dataclasses import dataclass
 
 
@@ -38,20 +38,9 @@ class Key:
 
 
 def parse(input_type: InputType):
-    data = parse_file(input_type)
-    lock_or_key = []
     locks = set()
     keys = set()
-    for row in data:
-        if not row:
-            if all([c == '#' for c in lock_or_key[0]]):
-                locks.add(Lock.from_rows(lock_or_key))
-            else:
-                keys.add(Key.from_rows(lock_or_key))
-            lock_or_key = []
-            continue
-        lock_or_key.append(row)
-    if lock_or_key:
+    for lock_or_key in iter_records(input_type):
         if all([c == '#' for c in lock_or_key[0]]):
             locks.add(Lock.from_rows(lock_or_key))
         else: